@@ -43,6 +43,8 @@ class SignalBot:
         self.risk_manager = RiskManager(self.config.trading)
         self.order_service = OrderService(self.config.trading, self.risk_manager)
         self.trading_service = TradingService(self.config)
+        # Connect now so a misconfigured broker fails at startup, not on the first signal
+        self.trading_service.ensure_backend()
         self.position_manager = PositionManager()
 
         # Register message handler
@@ -218,7 +220,8 @@ class SignalBot:
                     self.position_manager.add_position(
                         position_id=position_id,
                         order=order,
-                        actual_entry_price=actual_entry
+                        actual_entry_price=actual_entry,
+                        consume=True
                     )
                     
                     self.logger.info(
@@ -61,13 +61,15 @@ class CTraderConfig:
 
     rest_url: Optional[str] = None
     token: Optional[str] = None
+    keepalive_interval: float = 30.0  # seconds between keep-alive pings, 0 disables
 
     @classmethod
     def from_env(cls) -> "CTraderConfig":
         """Create configuration from environment variables."""
         return cls(
             rest_url=os.getenv("BROKER_REST_URL"),
-            token=os.getenv("CTRADER_TOKEN")
+            token=os.getenv("CTRADER_TOKEN"),
+            keepalive_interval=float(os.getenv("CTRADER_KEEPALIVE_INTERVAL", "30"))
         )
 
     def is_configured(self) -> bool:
@@ -82,6 +84,8 @@ class MT5Config:
     login: Optional[str] = None
     password: Optional[str] = None
     server: Optional[str] = None
+    keepalive_interval: float = 30.0  # seconds between terminal pings, 0 disables
+    tick_max_age_ms: float = 50.0  # cached ticks younger than this are reused
 
     @classmethod
     def from_env(cls) -> "MT5Config":
@@ -89,7 +93,9 @@ class MT5Config:
         return cls(
             login=os.getenv("MT5_LOGIN"),
             password=os.getenv("MT5_PASSWORD"),
-            server=os.getenv("MT5_SERVER")
+            server=os.getenv("MT5_SERVER"),
+            keepalive_interval=float(os.getenv("MT5_KEEPALIVE_INTERVAL", "30")),
+            tick_max_age_ms=float(os.getenv("MT5_TICK_MAX_AGE_MS", "50"))
         )
 
     def is_configured(self) -> bool:
@@ -110,6 +116,7 @@ class TradingConfig:
     max_volume: float = 1.0
     min_volume: float = 0.01
     account_balance: float = 10000.0
+    price_cache_ttl_ms: float = 250.0  # quotes younger than this are reused, 0 disables
 
     @classmethod
     def from_env(cls) -> "TradingConfig":
@@ -126,7 +133,8 @@ class TradingConfig:
             risk_percent=float(os.getenv("RISK_PERCENT", "1.0")),
             max_volume=float(os.getenv("MAX_VOLUME", "1.0")),
             min_volume=float(os.getenv("MIN_VOLUME", "0.01")),
-            account_balance=float(os.getenv("ACCOUNT_BALANCE", "10000.0"))
+            account_balance=float(os.getenv("ACCOUNT_BALANCE", "10000.0")),
+            price_cache_ttl_ms=float(os.getenv("PRICE_CACHE_TTL_MS", "250"))
         )
 
 
@@ -1,6 +1,5 @@
 """Domain models representing core business entities."""
 from dataclasses import dataclass, field
-from decimal import Decimal
 from enum import Enum
 from typing import Optional, List, Tuple
 from datetime import datetime
@@ -37,11 +36,11 @@ class Signal:
     Represents the raw signal data before being converted to an executable order.
     """
     symbol: Optional[str] = None
-    market_price: Optional[Decimal] = None
-    buy_range: Optional[Tuple[Decimal, Decimal]] = None
-    sell_range: Optional[Tuple[Decimal, Decimal]] = None
-    take_profits: List[Optional[Decimal]] = field(default_factory=list)
-    stop_loss: Optional[Decimal] = None
+    market_price: Optional[float] = None
+    buy_range: Optional[Tuple[float, float]] = None
+    sell_range: Optional[Tuple[float, float]] = None
+    take_profits: List[Optional[float]] = field(default_factory=list)
+    stop_loss: Optional[float] = None
     pip_count: Optional[int] = None
     side: Optional[TradeSide] = None
     raw_message: str = ""
@@ -67,7 +66,7 @@ class Signal:
              self.sell_range is not None)
         )
 
-    def get_entry_price(self) -> Optional[Decimal]:
+    def get_entry_price(self) -> Optional[float]:
         """Get the entry price for the signal."""
         if self.market_price:
             return self.market_price
@@ -82,7 +81,11 @@ class Signal:
 
         return None
 
-    def get_first_take_profit(self) -> Optional[Decimal]:
+    def get_take_profit_prices(self) -> List[float]:
+        """Get the take profit prices with unset levels dropped, as a new list."""
+        return [tp for tp in self.take_profits if tp is not None]
+
+    def get_first_take_profit(self) -> Optional[float]:
         """Get the first non-None take profit level."""
         for tp in self.take_profits:
             if tp is not None:
@@ -90,7 +93,7 @@ class Signal:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Executable trading order.
@@ -140,7 +143,7 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Active trading position.
@@ -168,7 +171,7 @@ class Position:
         return pnl
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo:
     """Trading account information."""
     balance: float
@@ -0,0 +1 @@
+"""Runtime metrics collection."""
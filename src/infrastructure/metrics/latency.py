@@ -0,0 +1,135 @@
+"""Latency tracking with fixed-bucket histograms for percentile estimates."""
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+class LatencyTracker:
+    """
+    Records per-operation latencies in microseconds.
+
+    Each operation keeps a rolling window of raw samples and a fixed-width
+    histogram of that same window, so recording is integer-only, percentiles
+    never need a sort, and old outliers age out with the window.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 4096,
+        bucket_us: int = 100,
+        bucket_count: int = 1024
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            window_size: Number of recent raw samples kept per operation
+            bucket_us: Width of one histogram bucket in microseconds
+            bucket_count: Number of histogram buckets before overflow
+        """
+        self.window_size = window_size
+        self.bucket_us = bucket_us
+        self.bucket_count = bucket_count
+        self._samples: Dict[str, Deque[int]] = {}
+        self._histograms: Dict[str, List[int]] = {}
+        self._overflow: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, latency_us: int) -> None:
+        """
+        Record one latency sample.
+
+        Args:
+            name: Operation name (e.g. 'order_to_ack')
+            latency_us: Measured latency in microseconds
+        """
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window_size)
+                self._histograms[name] = [0] * self.bucket_count
+                self._overflow[name] = 0
+                self._counts[name] = 0
+
+            if len(samples) == self.window_size:
+                # The oldest sample leaves the window: take it out of the histogram
+                self._bucket_add(name, samples[0], -1)
+            samples.append(latency_us)
+            self._bucket_add(name, latency_us, 1)
+            self._counts[name] += 1
+
+    def _bucket_add(self, name: str, latency_us: int, delta: int) -> None:
+        """Adjust the histogram bucket of a sample; caller holds the lock."""
+        bucket = latency_us // self.bucket_us
+        if bucket < self.bucket_count:
+            self._histograms[name][bucket] += delta
+        else:
+            self._overflow[name] += delta
+
+    def percentile(self, name: str, pct: float) -> Optional[int]:
+        """
+        Estimate a latency percentile over the recent window.
+
+        Args:
+            name: Operation name
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile in microseconds,
+            the window maximum if it falls in the overflow, or None without samples
+        """
+        with self._lock:
+            samples = self._samples.get(name)
+            if not samples:
+                return None
+
+            count = len(samples)
+
+            rank = max(1, -(-count * pct // 100))
+            seen = 0
+            for bucket, hits in enumerate(self._histograms[name]):
+                seen += hits
+                if seen >= rank:
+                    return (bucket + 1) * self.bucket_us
+            return max(samples)
+
+    def is_p99_degraded(self, name: str, threshold_us: int) -> bool:
+        """
+        Check whether the p99 latency of an operation exceeds a threshold.
+
+        Args:
+            name: Operation name
+            threshold_us: Alert threshold in microseconds
+
+        Returns:
+            True if p99 is above the threshold
+        """
+        p99 = self.percentile(name, 99)
+        return p99 is not None and p99 > threshold_us
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize every tracked operation.
+
+        Returns:
+            Dict of operation name -> total count, plus mean/max and
+            p50/p95/p99 estimates of the recent window, all in microseconds
+        """
+        with self._lock:
+            names = list(self._samples)
+
+        stats = {}
+        for name in names:
+            with self._lock:
+                window = list(self._samples[name])
+                count = self._counts[name]
+            stats[name] = {
+                'count': count,
+                'mean_us': sum(window) / len(window),
+                'max_us': max(window),
+                'p50_us': self.percentile(name, 50),
+                'p95_us': self.percentile(name, 95),
+                'p99_us': self.percentile(name, 99),
+            }
+        return stats
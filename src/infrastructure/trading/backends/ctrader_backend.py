@@ -1,7 +1,11 @@
 """cTrader trading backend implementation."""
-import requests
+import threading
 from typing import Optional, List
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from src.api.trading_backend import TradingBackend
 from src.domain.models import Order, Position, AccountInfo, TradeSide
 from src.core.config import CTraderConfig, TradingConfig
@@ -13,18 +17,42 @@ logger = get_logger(__name__)
 class CTraderBackend(TradingBackend):
     """cTrader REST API implementation."""
 
-    def __init__(self, config: CTraderConfig, trading_config: TradingConfig):
+    def __init__(
+        self,
+        config: CTraderConfig,
+        trading_config: TradingConfig,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize cTrader backend.
 
         Args:
             config: cTrader specific configuration
             trading_config: General trading configuration
+            session: HTTP session to reuse; a pooled keep-alive session is
+                created when omitted
         """
         self.config = config
         self.trading_config = trading_config
         self._initialized = False
 
+        # One session for every request so TCP/TLS connections are reused
+        self._session = session if session is not None else self._create_session()
+        self._session.headers.update(self._get_headers())
+
+        # Keep-alive ping thread state
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create an HTTP session with a connection pool and connect retries."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=Retry(total=2))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def is_available(self) -> bool:
         """Check if cTrader backend is properly configured."""
         return self.config.is_configured()
@@ -37,13 +65,13 @@ class CTraderBackend(TradingBackend):
 
         # Test connection
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.rest_url}/account",
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
             self._initialized = True
+            self._start_keepalive()
             logger.info("cTrader backend initialized successfully")
             return True
         except Exception as e:
@@ -52,9 +80,40 @@ class CTraderBackend(TradingBackend):
 
     def shutdown(self) -> None:
         """Shutdown cTrader connection."""
+        self._stop_keepalive()
         self._initialized = False
+        self._session.close()
         logger.info("cTrader backend connection closed")
 
+    def _start_keepalive(self) -> None:
+        """Start the background thread that keeps the broker connection warm."""
+        if self.config.keepalive_interval <= 0 or self._keepalive_thread is not None:
+            return
+
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="ctrader-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def _stop_keepalive(self) -> None:
+        """Signal the keep-alive thread to exit and wait for it."""
+        thread = self._keepalive_thread
+        if thread is None:
+            return
+
+        self._keepalive_stop.set()
+        thread.join(timeout=1.0)
+        self._keepalive_thread = None
+
+    def _keepalive_loop(self) -> None:
+        """Ping the API periodically so idle connections are not dropped."""
+        while not self._keepalive_stop.wait(self.config.keepalive_interval):
+            try:
+                self._session.get(f"{self.config.rest_url}/account", timeout=10)
+            except Exception as e:
+                logger.debug(f"cTrader keep-alive ping failed: {e}")
+
     def place_order(self, order: Order) -> dict:
         """
         Place order via cTrader REST API.
@@ -66,10 +125,11 @@ class CTraderBackend(TradingBackend):
             Order execution result
         """
         if self.trading_config.dry_run:
-            logger.info(f"[DRY RUN] Would place order: {order.to_dict()}")
+            order_dict = order.to_dict()
+            logger.info(f"[DRY RUN] Would place order: {order_dict}")
             return {
                 'status': 'dry_run',
-                'order': order.to_dict()
+                'order': order_dict
             }
 
         if not self._initialized:
@@ -80,10 +140,9 @@ class CTraderBackend(TradingBackend):
             payload = self._prepare_order_payload(order)
 
             # Send order
-            response = requests.post(
+            response = self._session.post(
                 f"{self.config.rest_url}/orders",
                 json=payload,
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
@@ -104,9 +163,8 @@ class CTraderBackend(TradingBackend):
             return None
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.rest_url}/account",
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
@@ -134,9 +192,8 @@ class CTraderBackend(TradingBackend):
             return []
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.rest_url}/positions",
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
@@ -171,9 +228,8 @@ class CTraderBackend(TradingBackend):
             return False
 
         try:
-            response = requests.delete(
+            response = self._session.delete(
                 f"{self.config.rest_url}/positions/{position_id}",
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
@@ -192,9 +248,8 @@ class CTraderBackend(TradingBackend):
             return None
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.rest_url}/symbols/{symbol}/price",
-                headers=self._get_headers(),
                 timeout=10
             )
             response.raise_for_status()
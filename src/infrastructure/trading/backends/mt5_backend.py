@@ -1,5 +1,12 @@
 """MetaTrader5 trading backend implementation."""
-from typing import Optional, List
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Optional, List, Tuple
 
 from src.api.trading_backend import TradingBackend
 from src.domain.models import Order, Position, AccountInfo, TradeSide, OrderType
@@ -13,6 +20,43 @@ logger = get_logger(__name__)
 class MT5Backend(TradingBackend):
     """MetaTrader5 API implementation."""
 
+    # Long enough to cover one order sequence; stops levels can widen around news
+    SYMBOL_INFO_TTL = 5.0
+    # Open positions table is reused for this long between trades
+    POSITIONS_TTL = 0.5
+    # Broker symbol universe only changes with trading sessions
+    SYMBOLS_TTL = 60.0
+    # Unresolvable symbol names are remembered for this long
+    SYMBOL_MISS_TTL = 30.0
+    # Reconnect attempts made by the health check, doubling the delay each time
+    RECONNECT_ATTEMPTS = 5
+    RECONNECT_BASE_DELAY = 1.0
+
+    # Common broker-specific decorations tried by find_symbol():
+    # "_o"/".a"-style suffixes, "m" for mini lots, "#" for stocks
+    _SYMBOL_SUFFIXES = ("_o", "m", ".a", ".b", ".c", "i")
+    _SYMBOL_PREFIXES = ("#",)
+    # Alternative broker names for common instruments, tried after variations
+    _SYMBOL_ALIASES = {
+        "XAUUSD": ("GOLD", "XAU/USD"),
+        "XAGUSD": ("SILVER", "XAG/USD"),
+        "BTCUSD": ("BITCOIN", "BTC/USD"),
+        "ETHUSD": ("ETHEREUM", "ETH/USD"),
+    }
+
+    # Read-only terminal calls whose concurrent identical requests share one IPC
+    _COALESCED_CALLS = frozenset({
+        "symbol_info", "symbol_info_tick", "symbols_get",
+        "positions_get", "account_info", "terminal_info",
+    })
+    # Terminal calls that change account state; cached positions and ticks
+    # are dropped once they complete
+    _WRITE_CALLS = frozenset({"order_send"})
+
+    # Resolved MetaTrader5 module, shared by all instances
+    _MT5_MODULE: Optional[Any] = None
+    _MT5_AVAILABLE: Optional[bool] = None
+
     def __init__(self, config: MT5Config, trading_config: TradingConfig):
         """
         Initialize MT5 backend.
@@ -25,14 +69,63 @@ class MT5Backend(TradingBackend):
         self.trading_config = trading_config
         self._initialized = False
         self._mt5 = None
+        # Symbols already confirmed visible in Market Watch this session
+        self._selected_symbols: set[str] = set()
+        # symbol -> (symbol_info, fetched_at)
+        self._symbol_info_cache: Dict[str, Tuple[Any, float]] = {}
+        # Exported symbol details (filling modes), bound once
+        self._symbol_cache = get_symbol_cache()
+        # symbol -> resolved order filling mode
+        self._filling_mode_cache: Dict[str, int] = {}
+        # (symbol names, fetched_at) from the last symbols_get() call
+        self._symbols_cache: Optional[Tuple[List[str], float]] = None
+        # Exact broker names, rebuilt with the symbols cache
+        self._symbols_set: frozenset[str] = frozenset()
+        # upper-cased name -> broker name, rebuilt with the symbols cache
+        self._symbols_upper: Dict[str, str] = {}
+        # first three upper-cased chars -> broker names, in broker order
+        self._symbols_by_prefix3: Dict[str, List[str]] = {}
+        # requested name -> (resolved name or None, resolved_at)
+        self._symbol_alias_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        # symbol -> (tick, fetched_at); shared with executor threads
+        self._tick_cache: Dict[str, Tuple[Any, float]] = {}
+        self._tick_lock = threading.Lock()
+        # Bumped after every write; reads started before it are not cached
+        self._write_generation = 0
+        # (ticket -> position record, fetched_at) from one positions_get() call
+        self._positions_cache: Optional[Tuple[Dict[int, Any], float]] = None
+        self._positions_lock = threading.Lock()
+        # Worker threads for the async wrappers, created on initialize
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Single thread that owns every terminal call, created on initialize
+        self._mt5_exec: Optional[ThreadPoolExecutor] = None
+        # (method, args) -> pending future for coalesced reads
+        self._inflight: Dict[Tuple[Any, ...], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Set by the health check when the terminal stops answering
+        self._connection_lost = False
+        self._reconnect_lock = threading.Lock()
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def _load_mt5(cls) -> Optional[Any]:
+        """Import MetaTrader5 once and cache the result on the class."""
+        if cls._MT5_MODULE is None and cls._MT5_AVAILABLE is not False:
+            try:
+                import MetaTrader5
+                cls._MT5_MODULE = MetaTrader5
+                cls._MT5_AVAILABLE = True
+            except ImportError:
+                cls._MT5_AVAILABLE = False
+        return cls._MT5_MODULE
 
     def is_available(self) -> bool:
         """Check if MetaTrader5 package is available."""
-        try:
-            import MetaTrader5
-            return True
-        except ImportError:
-            return False
+        if self._MT5_AVAILABLE is None:
+            # Locate the package without importing it (importing loads the terminal DLL)
+            type(self)._MT5_AVAILABLE = importlib.util.find_spec("MetaTrader5") is not None
+        return self._MT5_AVAILABLE
 
     def initialize(self) -> bool:
         """Initialize MT5 terminal connection."""
@@ -40,63 +133,434 @@ class MT5Backend(TradingBackend):
             logger.debug("MT5 already initialized")
             return True
 
-        try:
-            import MetaTrader5 as mt5
-            self._mt5 = mt5
-        except ImportError as e:
+        mt5 = self._load_mt5()
+        if mt5 is None:
             logger.error(
                 "MetaTrader5 package not available. "
                 "Install with 'pip install MetaTrader5' or switch to cTrader backend."
             )
             return False
 
+        self._bind_mt5(mt5)
+        self._mt5_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5-io")
+        if not self._connect_terminal():
+            self._mt5_exec.shutdown(wait=False)
+            self._mt5_exec = None
+            return False
+
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mt5")
+        self._initialized = True
+        # Build the symbol index up front so find_symbol resolves locally
+        self._get_symbol_names()
+        self._start_health_check()
+        return True
+
+    def _connect_terminal(self) -> bool:
+        """
+        Open the terminal session, logging in if credentials are configured.
+
+        Returns:
+            True if the terminal accepted the connection
+        """
         # Initialize with credentials if provided
         if self.config.is_configured():
             try:
                 login = int(self.config.login)
             except ValueError:
-                logger.error(f"MT5_LOGIN must be numeric, got: {self.config.login}")
+                logger.error("MT5_LOGIN must be numeric, got: %s", self.config.login)
                 return False
 
-            if not mt5.initialize(
+            if not self._mt5_call(
+                "initialize",
                 login=login,
                 password=self.config.password,
                 server=self.config.server
             ):
-                error = mt5.last_error()
+                error = self._mt5_call("last_error")
                 logger.error(
-                    f"MT5 initialization failed: {error}. "
-                    f"Account: {login}, Server: {self.config.server}"
+                    "MT5 initialization failed: %s. "
+                    "Account: %s, Server: %s",
+                    error, login, self.config.server
                 )
                 return False
 
-            logger.info(f"MT5 initialized with credentials (account: {login})")
+            logger.info("MT5 initialized with credentials (account: %s)", login)
         else:
             # Initialize without credentials (use existing terminal session)
-            if not mt5.initialize():
-                error = mt5.last_error()
+            if not self._mt5_call("initialize"):
+                error = self._mt5_call("last_error")
                 logger.error(
-                    f"MT5 initialization failed: {error}. "
-                    "Ensure MT5 terminal is running and logged in."
+                    "MT5 initialization failed: %s. "
+                    "Ensure MT5 terminal is running and logged in.",
+                    error
                 )
                 return False
 
             logger.info("MT5 initialized using existing terminal session")
 
-        self._initialized = True
         return True
 
+    def _bind_mt5(self, mt5: Any) -> None:
+        """
+        Bind the MT5 module and precompute the static parts of trade requests.
+
+        Args:
+            mt5: The MetaTrader5 module
+        """
+        self._mt5 = mt5
+        self._type_buy = mt5.ORDER_TYPE_BUY
+        self._type_sell = mt5.ORDER_TYPE_SELL
+        self._retcode_done = mt5.TRADE_RETCODE_DONE
+        self._fill_ioc = mt5.ORDER_FILLING_IOC
+        self._action_sltp = mt5.TRADE_ACTION_SLTP
+        self._order_template = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "deviation": 20,
+            "magic": 234000,
+            "comment": "Signal Bot",
+            "type_time": mt5.ORDER_TIME_GTC,
+        }
+        self._close_template = {**self._order_template, "comment": "Close by bot"}
+
     def shutdown(self) -> None:
         """Shutdown MT5 connection."""
         if not self._initialized or not self._mt5:
             return
 
         try:
-            self._mt5.shutdown()
+            self._stop_health_check()
+            self._mt5_call("shutdown")
             self._initialized = False
+            self._clear_session_caches()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._mt5_exec is not None:
+                self._mt5_exec.shutdown(wait=False)
+                self._mt5_exec = None
             logger.info("MT5 connection closed")
         except Exception as e:
-            logger.warning(f"Error shutting down MT5: {e}")
+            logger.warning("Error shutting down MT5: %s", e)
+
+    def _mt5_call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a MetaTrader5 function on the terminal's dedicated thread.
+
+        The binding serializes calls over a single terminal connection anyway,
+        so funnelling them through one thread costs nothing and lets identical
+        concurrent reads (e.g. two callers asking for the same tick) share a
+        single round-trip.
+
+        Args:
+            name: MetaTrader5 function name
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            Whatever the MetaTrader5 function returns
+        """
+        func = getattr(self._mt5, name)
+        executor = self._mt5_exec
+        if executor is None:
+            result = func(*args, **kwargs)
+        elif kwargs or name not in self._COALESCED_CALLS:
+            with self._inflight_lock:
+                # Reads queued after this call must not attach to reads queued
+                # before it, or they could see the state from before a write
+                self._inflight.clear()
+                future = executor.submit(func, *args, **kwargs)
+            result = future.result()
+        else:
+            return self._coalesced_call(name, func, args, executor)
+
+        if name in self._WRITE_CALLS:
+            self._invalidate_after_write()
+        return result
+
+    def _coalesced_call(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        executor: ThreadPoolExecutor
+    ) -> Any:
+        """Run a read on the terminal thread, sharing any identical pending read."""
+        key = (name, args)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = executor.submit(func, *args)
+                self._inflight[key] = future
+        if owner:
+            # Registered outside the lock: runs inline if already finished
+            future.add_done_callback(lambda done: self._discard_inflight(key, done))
+        return future.result()
+
+    def _invalidate_after_write(self) -> None:
+        """Drop position and tick snapshots that a completed write may have changed."""
+        with self._tick_lock, self._positions_lock:
+            self._write_generation += 1
+            self._tick_cache.clear()
+            self._positions_cache = None
+
+    def _discard_inflight(self, key: Tuple[Any, ...], future: Future) -> None:
+        """Forget a finished coalesced read so the next caller re-queries."""
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _clear_session_caches(self) -> None:
+        """Drop everything cached from the current terminal session."""
+        self._selected_symbols.clear()
+        self._symbol_info_cache.clear()
+        self._filling_mode_cache.clear()
+        self._symbol_alias_cache.clear()
+        self._symbols_cache = None
+        self._symbols_set = frozenset()
+        self._symbols_upper = {}
+        self._symbols_by_prefix3 = {}
+        with self._tick_lock:
+            self._tick_cache.clear()
+        self._invalidate_positions()
+
+    def _start_health_check(self) -> None:
+        """Start the background thread that keeps the terminal session alive."""
+        if self.config.keepalive_interval <= 0 or self._health_thread is not None:
+            return
+
+        self._health_stop.clear()
+        self._health_thread = threading.Thread(
+            target=self._health_check_loop, name="mt5-health", daemon=True
+        )
+        self._health_thread.start()
+
+    def _stop_health_check(self) -> None:
+        """Signal the health check thread to exit and wait for it."""
+        thread = self._health_thread
+        if thread is None:
+            return
+
+        self._health_stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._health_thread = None
+
+    def _health_check_loop(self) -> None:
+        """Ping the terminal periodically and reconnect once when it drops."""
+        while not self._health_stop.wait(self.config.keepalive_interval):
+            try:
+                alive = self._mt5_call("terminal_info") is not None
+            except Exception as e:
+                logger.debug("MT5 terminal ping failed: %s", e)
+                alive = False
+
+            if not alive and not self._connection_lost:
+                logger.warning("MT5 terminal not responding, reconnecting")
+                self._connection_lost = True
+                self._reconnect(attempts=self.RECONNECT_ATTEMPTS)
+
+    def _reconnect(self, attempts: int = 1) -> bool:
+        """
+        Re-open the terminal session with exponential backoff.
+
+        Args:
+            attempts: Maximum number of connection attempts
+
+        Returns:
+            True if the session was restored
+        """
+        with self._reconnect_lock:
+            if not self._connection_lost:
+                # Another thread already restored the session
+                return True
+
+            delay = self.RECONNECT_BASE_DELAY
+            for attempt in range(1, attempts + 1):
+                try:
+                    self._mt5_call("shutdown")
+                except Exception:
+                    pass
+                self._clear_session_caches()
+
+                if self._connect_terminal():
+                    self._connection_lost = False
+                    logger.info("MT5 reconnected (attempt %s)", attempt)
+                    return True
+
+                if attempt < attempts and self._health_stop.wait(delay):
+                    break
+                delay *= 2
+
+            logger.error("MT5 reconnect failed after %s attempt(s)", attempts)
+            return False
+
+    def _ensure_connected(self) -> bool:
+        """
+        Make sure the terminal session is usable before talking to it.
+
+        The health check thread does the pinging, so the common case is a
+        flag check; only a session marked lost triggers a reconnect here.
+
+        Returns:
+            True if the session is connected
+        """
+        if not self._connection_lost:
+            return True
+        return self._reconnect()
+
+    def _get_symbol_info(self, symbol: str) -> Optional[Any]:
+        """
+        Get symbol info, served from cache while it is fresh.
+
+        Args:
+            symbol: Symbol name
+
+        Returns:
+            MT5 symbol info or None if the symbol does not exist
+        """
+        cached = self._symbol_info_cache.get(symbol)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self.SYMBOL_INFO_TTL:
+            return cached[0]
+
+        sym_info = self._mt5_call("symbol_info", symbol)
+        if sym_info is not None:
+            self._symbol_info_cache[symbol] = (sym_info, now)
+        return sym_info
+
+    def _fresh_tick(
+        self,
+        symbol: str,
+        max_age_ms: Optional[float] = None,
+        fresh: bool = False
+    ) -> Optional[Any]:
+        """
+        Get the latest tick for a symbol, reusing a recent one if available.
+
+        Bursts of orders on the same symbol see identical prices within a few
+        milliseconds, so only the first call pays the terminal round-trip.
+
+        Args:
+            symbol: Symbol name
+            max_age_ms: Maximum age of a cached tick in milliseconds
+                (defaults to MT5Config.tick_max_age_ms)
+            fresh: Always query the terminal, ignoring the cache
+
+        Returns:
+            MT5 tick or None if unavailable
+        """
+        now = time.monotonic()
+        if not fresh:
+            if max_age_ms is None:
+                max_age_ms = self.config.tick_max_age_ms
+            with self._tick_lock:
+                cached = self._tick_cache.get(symbol)
+            if cached is not None and (now - cached[1]) * 1000 < max_age_ms:
+                return cached[0]
+
+        generation = self._write_generation
+        tick = self._mt5_call("symbol_info_tick", symbol)
+        if tick is not None:
+            with self._tick_lock:
+                # A tick fetched across a write may predate it: use, don't cache
+                if generation == self._write_generation:
+                    self._tick_cache[symbol] = (tick, now)
+        return tick
+
+    def _resolve_filling_mode(self, symbol: str) -> int:
+        """
+        Get the order filling mode for a symbol, resolved once per session.
+
+        Args:
+            symbol: Symbol name
+
+        Returns:
+            MT5 filling mode, IOC if the symbol cache has no entry
+        """
+        filling_mode = self._filling_mode_cache.get(symbol)
+        if filling_mode is not None:
+            return filling_mode
+
+        # Get best filling mode for this symbol from cache
+        fill_ioc = self._fill_ioc
+        filling_mode = self._symbol_cache.get_best_filling_mode(
+            symbol,
+            preferred_mode=fill_ioc
+        )
+
+        # Fallback to IOC if cache is not loaded or symbol not found
+        if filling_mode is None:
+            filling_mode = fill_ioc
+            logger.warning(
+                "Using default filling mode (IOC) for %s. "
+                "Consider running export_symbols_details.py to cache symbol info.",
+                symbol
+            )
+        else:
+            logger.debug("Using filling mode %s for %s", filling_mode, symbol)
+
+        self._filling_mode_cache[symbol] = filling_mode
+        return filling_mode
+
+    def refresh_symbol_cache(self) -> None:
+        """Rebind the symbol details cache and forget resolved filling modes."""
+        self._symbol_cache = get_symbol_cache()
+        self._filling_mode_cache.clear()
+
+    def _positions_snapshot(self) -> Optional[Dict[int, Any]]:
+        """
+        Get open position records by ticket, reusing a recent snapshot.
+
+        A table fetched while a write was in flight is returned but not cached,
+        since it may predate the write.
+
+        Returns:
+            Dict of ticket -> MT5 position record, or None if the call failed
+        """
+        now = time.monotonic()
+        cached = self._positions_cache
+        if cached is not None and now - cached[1] < self.POSITIONS_TTL:
+            return cached[0]
+
+        generation = self._write_generation
+        positions = self._mt5_call("positions_get")
+        if positions is None:
+            return None
+
+        by_ticket = {pos.ticket: pos for pos in positions}
+        with self._positions_lock:
+            if generation == self._write_generation:
+                self._positions_cache = (by_ticket, now)
+        return by_ticket
+
+    def _get_open_positions(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Get all open position records, reusing a recent snapshot.
+
+        Returns:
+            Tuple of MT5 position records or None if the terminal call failed
+        """
+        by_ticket = self._positions_snapshot()
+        return None if by_ticket is None else tuple(by_ticket.values())
+
+    def _get_position(self, ticket: int) -> Optional[Any]:
+        """
+        Get a single open position record by ticket.
+
+        Args:
+            ticket: Position ticket number
+
+        Returns:
+            MT5 position record or None if not found
+        """
+        by_ticket = self._positions_snapshot()
+        return None if by_ticket is None else by_ticket.get(ticket)
+
+    def _invalidate_positions(self) -> None:
+        """Force the next position lookup to query the terminal."""
+        with self._positions_lock:
+            self._positions_cache = None
 
     def _validate_stops(
         self, 
@@ -120,44 +584,49 @@ class MT5Backend(TradingBackend):
         Returns:
             True if valid, False if invalid (but doesn't modify values)
         """
-        mt5 = self._mt5
-        sym_info = mt5.symbol_info(symbol)
-        
-        if sym_info is None:
-            logger.warning(f"Could not get symbol info for {symbol}")
-            return True  # Can't validate, assume OK
-        
-        is_buy = order_type == mt5.ORDER_TYPE_BUY
+        if stop_loss is None and take_profit is None:
+            return True
+
+        is_buy = order_type == self._type_buy
         is_valid = True
         
         # Validate that stops are on the correct side of price
         if stop_loss is not None:
             if is_buy and stop_loss >= price:
                 logger.error(
-                    f"❌ Invalid SL for BUY: SL={stop_loss:.5f} must be BELOW entry={price:.5f}"
+                    "❌ Invalid SL for BUY: SL=%.5f must be BELOW entry=%.5f",
+                    stop_loss, price
                 )
                 is_valid = False
             elif not is_buy and stop_loss <= price:
                 logger.error(
-                    f"❌ Invalid SL for SELL: SL={stop_loss:.5f} must be ABOVE entry={price:.5f}"
+                    "❌ Invalid SL for SELL: SL=%.5f must be ABOVE entry=%.5f",
+                    stop_loss, price
                 )
                 is_valid = False
         
         if take_profit is not None:
             if is_buy and take_profit <= price:
                 logger.error(
-                    f"❌ Invalid TP for BUY: TP={take_profit:.5f} must be ABOVE entry={price:.5f}"
+                    "❌ Invalid TP for BUY: TP=%.5f must be ABOVE entry=%.5f",
+                    take_profit, price
                 )
                 is_valid = False
             elif not is_buy and take_profit >= price:
                 logger.error(
-                    f"❌ Invalid TP for SELL: TP={take_profit:.5f} must be BELOW entry={price:.5f}"
+                    "❌ Invalid TP for SELL: TP=%.5f must be BELOW entry=%.5f",
+                    take_profit, price
                 )
                 is_valid = False
         
-        # Check minimum distance if broker enforces it
-        stops_level = sym_info.trade_stops_level
-        point = sym_info.point
+        # Check minimum distance if broker enforces it; symbol info is only
+        # needed from here on, and its TTL picks up stops levels widened by news
+        sym_info = self._get_symbol_info(symbol)
+        if sym_info is None:
+            logger.warning("Could not get symbol info for %s", symbol)
+            return is_valid  # Can't check distances, keep the side checks
+
+        stops_level, point = sym_info.trade_stops_level, sym_info.point
         min_distance = stops_level * point
         
         if stops_level > 0:
@@ -165,16 +634,18 @@ class MT5Backend(TradingBackend):
                 actual_distance = abs(price - stop_loss)
                 if actual_distance < min_distance:
                     logger.warning(
-                        f"⚠️  SL too close: distance={actual_distance:.5f}, "
-                        f"minimum={min_distance:.5f} ({stops_level} points)"
+                        "⚠️  SL too close: distance=%.5f, "
+                        "minimum=%.5f (%s points)",
+                        actual_distance, min_distance, stops_level
                     )
             
             if take_profit is not None:
                 actual_distance = abs(price - take_profit)
                 if actual_distance < min_distance:
                     logger.warning(
-                        f"⚠️  TP too close: distance={actual_distance:.5f}, "
-                        f"minimum={min_distance:.5f} ({stops_level} points)"
+                        "⚠️  TP too close: distance=%.5f, "
+                        "minimum=%.5f (%s points)",
+                        actual_distance, min_distance, stops_level
                     )
         
         return is_valid
@@ -190,16 +661,21 @@ class MT5Backend(TradingBackend):
             Order execution result
         """
         if self.trading_config.dry_run:
-            logger.info(f"[DRY RUN][MT5] Would place order: {order.to_dict()}")
+            # Serialise once; the same dict is logged and returned
+            order_dict = order.to_dict()
+            logger.info("[DRY RUN][MT5] Would place order: %s", order_dict)
             return {
                 'status': 'dry_run',
-                'order': order.to_dict()
+                'order': order_dict
             }
 
         if not self._initialized:
             raise RuntimeError("MT5 backend not initialized")
+        if not self._ensure_connected():
+            raise RuntimeError("MT5 terminal connection lost")
 
-        mt5 = self._mt5
+        # Bind terminal constants to locals for the hot path
+        type_buy, type_sell = self._type_buy, self._type_sell
         
         # Find the actual symbol name in MT5
         actual_symbol = self.find_symbol(order.symbol)
@@ -214,17 +690,24 @@ class MT5Backend(TradingBackend):
         symbol = actual_symbol
         volume = order.volume
 
-        # Ensure symbol is available
-        sym_info = mt5.symbol_info(symbol)
-        if sym_info is None:
-            raise ValueError(f"Symbol {symbol} not found in MT5")
+        # Ensure symbol is available (only checked once per session)
+        if symbol not in self._selected_symbols:
+            sym_info = self._get_symbol_info(symbol)
+            if sym_info is None:
+                raise ValueError(f"Symbol {symbol} not found in MT5")
+
+            if not sym_info.visible:
+                if not self._mt5_call("symbol_select", symbol, True):
+                    raise ValueError(f"Failed to enable symbol {symbol}")
+                # Market Watch changed; forget cached name resolutions and
+                # the stale visible=False record
+                self._symbol_alias_cache.clear()
+                self._symbol_info_cache.pop(symbol, None)
 
-        if not sym_info.visible:
-            if not mt5.symbol_select(symbol, True):
-                raise ValueError(f"Failed to enable symbol {symbol}")
+            self._selected_symbols.add(symbol)
 
         # Get current price
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self._fresh_tick(symbol)
         if tick is None:
             raise ValueError(f"Failed to get tick data for {symbol}")
 
@@ -236,36 +719,23 @@ class MT5Backend(TradingBackend):
 
         # Determine MT5 order type
         if order.side == TradeSide.BUY:
-            mt5_type = mt5.ORDER_TYPE_BUY
+            mt5_type = type_buy
         else:
-            mt5_type = mt5.ORDER_TYPE_SELL
+            mt5_type = type_sell
 
-        # Get best filling mode for this symbol from cache
-        symbol_cache = get_symbol_cache()
-        filling_mode = symbol_cache.get_best_filling_mode(
-            symbol, 
-            preferred_mode=mt5.ORDER_FILLING_IOC
-        )
-        
-        # Fallback to IOC if cache is not loaded or symbol not found
-        if filling_mode is None:
-            filling_mode = mt5.ORDER_FILLING_IOC
-            logger.warning(
-                f"Using default filling mode (IOC) for {symbol}. "
-                "Consider running export_symbols_details.py to cache symbol info."
-            )
-        else:
-            logger.debug(f"Using filling mode {filling_mode} for {symbol}")
+        filling_mode = self._resolve_filling_mode(symbol)
 
         # Validate stops - use only first TP for initial order
         # We'll manage multiple TPs through position manager
         sl = order.stop_loss
         tp = order.take_profits[0] if order.take_profits else None
         
-        logger.info(
-            f"Order details - Entry: {price:.5f}, SL: {sl}, "
-            f"All TPs: {order.take_profits}, Side: {order.side.value.upper()}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Order details - Entry: %.5f, SL: %s, "
+                "All TPs: %s, Side: %s",
+                price, sl, order.take_profits, order.side.value.upper()
+            )
         
         # Validate without adjusting
         if sl is not None or tp is not None:
@@ -282,50 +752,43 @@ class MT5Backend(TradingBackend):
                     f"TP={'above' if order.side == TradeSide.BUY else 'below'} entry"
                 )
 
-        # Build trade request
+        # Build trade request; SL and first TP are included only when set
         request = {
-            "action": mt5.TRADE_ACTION_DEAL,
+            **self._order_template,
             "symbol": symbol,
             "volume": volume,
             "type": mt5_type,
             "price": float(price),
-            "deviation": 20,
-            "magic": 234000,
-            "comment": "Signal Bot",
-            "type_time": mt5.ORDER_TIME_GTC,
             "type_filling": filling_mode,
+            **({"sl": float(sl)} if sl is not None else {}),
+            **({"tp": float(tp)} if tp is not None else {}),
         }
 
-        # Add stop loss if valid
-        if sl is not None:
-            request["sl"] = float(sl)
-
-        # Add take profit if valid (only first one)
-        if tp is not None:
-            request["tp"] = float(tp)
-
         # Send order
-        result = mt5.order_send(request)
+        result = self._mt5_call("order_send", request)
 
         if result is None:
-            error = mt5.last_error()
-            logger.error(f"Order send failed: {error}")
-            logger.error(f"Request details: {request}")
+            error = self._mt5_call("last_error")
+            logger.error("Order send failed: %s", error)
+            logger.error("Request details: %s", request)
             raise RuntimeError(f"MT5 order_send failed: {error}")
 
-        if result.retcode != mt5.TRADE_RETCODE_DONE:
+        if result.retcode != self._retcode_done:
+            sym_info = self._get_symbol_info(symbol)
             error_details = (
                 f"Order failed: {result.comment} (retcode: {result.retcode})\n"
                 f"Symbol: {symbol}, Price: {price}, Volume: {volume}\n"
                 f"SL: {request.get('sl', 'None')}, TP: {request.get('tp', 'None')}\n"
-                f"Stops Level: {sym_info.trade_stops_level} points, Point: {sym_info.point}"
+                f"Stops Level: {getattr(sym_info, 'trade_stops_level', 'N/A')} points, "
+                f"Point: {getattr(sym_info, 'point', 'N/A')}"
             )
             logger.error(error_details)
             raise RuntimeError(error_details)
 
         logger.info(
-            f"Order executed successfully: "
-            f"Order={result.order}, Deal={result.deal}, Volume={result.volume}"
+            "Order executed successfully: "
+            "Order=%s, Deal=%s, Volume=%s",
+            result.order, result.deal, result.volume
         )
 
         return {
@@ -338,17 +801,62 @@ class MT5Backend(TradingBackend):
             'retcode': result.retcode
         }
 
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking MT5 call on the backend's worker threads.
+
+        Falls back to the event loop's default executor before initialize().
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def place_order_async(self, order: Order) -> dict:
+        """
+        Place order via MT5 API without blocking the event loop.
+
+        The MetaTrader5 Python package only exposes a blocking order_send,
+        so the call is run in an executor thread while the caller awaits.
+
+        Args:
+            order: Order to execute
+
+        Returns:
+            Order execution result
+        """
+        return await self._run_blocking(self.place_order, order)
+
+    async def place_orders(self, orders: List[Order]) -> List[dict]:
+        """
+        Place several orders concurrently.
+
+        Submissions overlap so a burst of N signals costs roughly one broker
+        round-trip instead of N. A failed order does not cancel the others;
+        its exception is returned in place of the result.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            List of execution results (or exceptions), in the same order
+        """
+        return await asyncio.gather(
+            *(self.place_order_async(order) for order in orders),
+            return_exceptions=True
+        )
+
     def get_account_info(self) -> Optional[AccountInfo]:
         """Get MT5 account information."""
         if not self._initialized or not self._mt5:
             logger.warning("MT5 backend not initialized")
             return None
+        if not self._ensure_connected():
+            return None
 
         try:
-            account_info = self._mt5.account_info()
+            account_info = self._mt5_call("account_info")
             if account_info is None:
-                error = self._mt5.last_error()
-                logger.error(f"Failed to get account info: {error}")
+                error = self._mt5_call("last_error")
+                logger.error("Failed to get account info: %s", error)
                 return None
 
             return AccountInfo(
@@ -362,116 +870,212 @@ class MT5Backend(TradingBackend):
             )
 
         except Exception as e:
-            logger.error(f"Error getting account info: {e}")
+            logger.error("Error getting account info: %s", e)
             return None
 
     def get_positions(self) -> List[Position]:
-        """Get all open positions from MT5."""
+        """
+        Get all open positions from MT5.
+
+        Use get_positions_soa() instead for aggregates or price comparisons
+        over many positions; it skips building a Position per row.
+        """
         if not self._initialized or not self._mt5:
             logger.warning("MT5 backend not initialized")
             return []
+        if not self._ensure_connected():
+            return []
 
         try:
-            positions = self._mt5.positions_get()
+            positions = self._get_open_positions()
             if positions is None:
-                error = self._mt5.last_error()
-                logger.error(f"Failed to get positions: {error}")
+                error = self._mt5_call("last_error")
+                logger.error("Failed to get positions: %s", error)
                 return []
 
-            result = []
-            for pos in positions:
-                position = Position(
+            buy, sell = TradeSide.BUY, TradeSide.SELL
+            type_buy = self._type_buy
+            return [
+                Position(
                     symbol=pos.symbol,
-                    side=TradeSide.BUY if pos.type == 0 else TradeSide.SELL,
+                    side=buy if pos.type == type_buy else sell,
                     volume=pos.volume,
                     entry_price=pos.price_open,
                     current_price=pos.price_current,
-                    stop_loss=pos.sl if pos.sl > 0 else None,
-                    take_profit=pos.tp if pos.tp > 0 else None,
+                    # MT5 reports unset stops as 0.0
+                    stop_loss=pos.sl or None,
+                    take_profit=pos.tp or None,
                     position_id=str(pos.ticket),
                     unrealized_pnl=pos.profit
                 )
-                result.append(position)
-
-            return result
+                for pos in positions
+            ]
 
         except Exception as e:
-            logger.error(f"Error getting positions: {e}")
+            logger.error("Error getting positions: %s", e)
             return []
 
+    def get_positions_soa(self) -> Dict[str, Any]:
+        """
+        Get all open positions as one contiguous NumPy array per field.
+
+        This is the vectorized positions view: sums such as
+        ``soa["pnls"].sum()`` and comparisons such as
+        ``soa["current_prices"] >= soa["tps"]`` run over packed data.
+        NumPy is always installed alongside the MetaTrader5 package.
+
+        Returns:
+            Dictionary with tickets, symbols, types, volumes, entry_prices,
+            current_prices, sls, tps and pnls arrays (empty if unavailable)
+        """
+        import numpy as np
+
+        positions: Tuple[Any, ...] = ()
+        if not self._initialized or not self._mt5:
+            logger.warning("MT5 backend not initialized")
+        elif self._ensure_connected():
+            positions = self._get_open_positions()
+            if positions is None:
+                logger.error("Failed to get positions: %s", self._mt5_call("last_error"))
+                positions = ()
+
+        count = len(positions)
+
+        def column(attr: str, dtype: Any) -> Any:
+            return np.fromiter(
+                (getattr(pos, attr) for pos in positions), dtype=dtype, count=count
+            )
+
+        return {
+            'tickets': column('ticket', np.int64),
+            'symbols': np.array([pos.symbol for pos in positions], dtype='U32'),
+            'types': column('type', np.int32),
+            'volumes': column('volume', np.float64),
+            'entry_prices': column('price_open', np.float64),
+            'current_prices': column('price_current', np.float64),
+            'sls': column('sl', np.float64),
+            'tps': column('tp', np.float64),
+            'pnls': column('profit', np.float64),
+        }
+
     def close_position(self, position_id: str) -> bool:
         """Close a position in MT5."""
         if not self._initialized or not self._mt5:
             logger.error("MT5 backend not initialized")
             return False
+        if not self._ensure_connected():
+            return False
 
         try:
             ticket = int(position_id)
-            mt5 = self._mt5
 
             # Get position info
-            position = mt5.positions_get(ticket=ticket)
-            if not position:
-                logger.error(f"Position {position_id} not found")
+            pos = self._get_position(ticket)
+            if pos is None:
+                logger.error("Position %s not found", position_id)
                 return False
 
-            pos = position[0]
+            return self._close_open_position(pos)
 
-            # Determine closing type (opposite of opening)
-            close_type = mt5.ORDER_TYPE_SELL if pos.type == 0 else mt5.ORDER_TYPE_BUY
+        except Exception as e:
+            logger.error("Error closing position %s: %s", position_id, e)
+            return False
 
-            # Get current price
-            tick = mt5.symbol_info_tick(pos.symbol)
-            if tick is None:
-                logger.error(f"Failed to get tick for {pos.symbol}")
-                return False
+    async def close_positions(self, position_ids: List[str]) -> Dict[str, bool]:
+        """
+        Close several positions concurrently.
 
-            close_price = tick.bid if pos.type == 0 else tick.ask
+        All open positions are fetched with a single positions_get() call and
+        the close requests are then dispatched in parallel executor threads.
 
-            # Get best filling mode for this symbol from cache
-            symbol_cache = get_symbol_cache()
-            filling_mode = symbol_cache.get_best_filling_mode(
-                pos.symbol,
-                preferred_mode=mt5.ORDER_FILLING_IOC
-            )
-            
-            # Fallback to IOC if cache is not loaded or symbol not found
-            if filling_mode is None:
-                filling_mode = mt5.ORDER_FILLING_IOC
-                logger.warning(
-                    f"Using default filling mode (IOC) for {pos.symbol}. "
-                    "Consider running export_symbols_details.py to cache symbol info."
-                )
+        Args:
+            position_ids: IDs of the positions to close
 
-            # Close request
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": pos.symbol,
-                "volume": pos.volume,
-                "type": close_type,
-                "position": ticket,
-                "price": close_price,
-                "deviation": 20,
-                "magic": 234000,
-                "comment": "Close by bot",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": filling_mode,
-            }
+        Returns:
+            Dictionary mapping each position ID to whether it was closed
+        """
+        if not self._initialized or not self._mt5:
+            logger.error("MT5 backend not initialized")
+            return {position_id: False for position_id in position_ids}
+        if not self._ensure_connected():
+            return {position_id: False for position_id in position_ids}
+
+        positions = self._get_open_positions() or ()
+        by_ticket = {str(pos.ticket): pos for pos in positions}
+
+        results = {}
+        pending = []
+        for position_id in position_ids:
+            pos = by_ticket.get(position_id)
+            if pos is None:
+                logger.error("Position %s not found", position_id)
+                results[position_id] = False
+            else:
+                pending.append(position_id)
+
+        outcomes = await asyncio.gather(
+            *(
+                self._run_blocking(self._close_open_position, by_ticket[position_id])
+                for position_id in pending
+            ),
+            return_exceptions=True
+        )
 
-            result = mt5.order_send(request)
+        for position_id, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error closing position %s: %s", position_id, outcome)
+                outcome = False
+            results[position_id] = outcome
 
-            if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
-                error = result.comment if result else mt5.last_error()
-                logger.error(f"Failed to close position {position_id}: {error}")
-                return False
+        return results
 
-            logger.info(f"Position {position_id} closed successfully")
-            return True
+    def _close_open_position(self, pos: Any) -> bool:
+        """
+        Send a full close request for a position record.
 
-        except Exception as e:
-            logger.error(f"Error closing position {position_id}: {e}")
+        Args:
+            pos: MT5 position record as returned by positions_get()
+
+        Returns:
+            True if successful, False otherwise
+        """
+        position_id = pos.ticket
+        is_buy = pos.type == self._type_buy
+
+        # Determine closing type (opposite of opening)
+        close_type = self._type_sell if is_buy else self._type_buy
+
+        # Get current price
+        tick = self._fresh_tick(pos.symbol)
+        if tick is None:
+            logger.error("Failed to get tick for %s", pos.symbol)
+            return False
+
+        close_price = tick.bid if is_buy else tick.ask
+
+        filling_mode = self._resolve_filling_mode(pos.symbol)
+
+        # Close request
+        request = {
+            **self._close_template,
+            "symbol": pos.symbol,
+            "volume": pos.volume,
+            "type": close_type,
+            "position": pos.ticket,
+            "price": close_price,
+            "type_filling": filling_mode,
+        }
+
+        result = self._mt5_call("order_send", request)
+
+        if result is None or result.retcode != self._retcode_done:
+            error = result.comment if result else self._mt5_call("last_error")
+            logger.error("Failed to close position %s: %s", position_id, error)
             return False
 
+        logger.info("Position %s closed successfully", position_id)
+        return True
+
     def close_position_partial(
         self, 
         position_id: str, 
@@ -490,79 +1094,136 @@ class MT5Backend(TradingBackend):
         if not self._initialized or not self._mt5:
             logger.error("MT5 backend not initialized")
             return False
+        if not self._ensure_connected():
+            return False
 
         try:
             ticket = int(position_id)
-            mt5 = self._mt5
 
             # Get position info
-            position = mt5.positions_get(ticket=ticket)
-            if not position:
-                logger.error(f"Position {position_id} not found")
+            pos = self._get_position(ticket)
+            if pos is None:
+                logger.error("Position %s not found", position_id)
                 return False
 
-            pos = position[0]
+            return self._close_open_position_partial(pos, volume)
 
-            # Validate volume
-            if volume > pos.volume:
-                logger.error(
-                    f"Cannot close {volume} lots, position only has {pos.volume} lots"
-                )
-                return False
+        except Exception as e:
+            logger.error("Error partially closing position %s: %s", position_id, e)
+            return False
 
-            # Determine closing type (opposite of opening)
-            close_type = mt5.ORDER_TYPE_SELL if pos.type == 0 else mt5.ORDER_TYPE_BUY
+    async def close_positions_partial(
+        self,
+        closes: List[Tuple[str, float]]
+    ) -> Dict[str, bool]:
+        """
+        Partially close several positions concurrently.
 
-            # Get current price
-            tick = mt5.symbol_info_tick(pos.symbol)
-            if tick is None:
-                logger.error(f"Failed to get tick for {pos.symbol}")
-                return False
+        Used to take a multi-TP ladder off in one burst: open positions are
+        fetched with a single positions_get() call and the close requests are
+        then dispatched in parallel executor threads.
 
-            close_price = tick.bid if pos.type == 0 else tick.ask
+        Args:
+            closes: (position_id, volume) pairs
 
-            # Get filling mode
-            symbol_cache = get_symbol_cache()
-            filling_mode = symbol_cache.get_best_filling_mode(
-                pos.symbol,
-                preferred_mode=mt5.ORDER_FILLING_IOC
-            )
-            
-            if filling_mode is None:
-                filling_mode = mt5.ORDER_FILLING_IOC
+        Returns:
+            Dictionary mapping each position ID to whether it was closed
+        """
+        if not self._initialized or not self._mt5:
+            logger.error("MT5 backend not initialized")
+            return {position_id: False for position_id, _ in closes}
+        if not self._ensure_connected():
+            return {position_id: False for position_id, _ in closes}
+
+        positions = self._get_open_positions() or ()
+        by_ticket = {str(pos.ticket): pos for pos in positions}
+
+        results = {}
+        pending = []
+        for position_id, volume in closes:
+            pos = by_ticket.get(position_id)
+            if pos is None:
+                logger.error("Position %s not found", position_id)
+                results[position_id] = False
+            else:
+                pending.append((position_id, pos, volume))
+
+        outcomes = await asyncio.gather(
+            *(
+                self._run_blocking(self._close_open_position_partial, pos, volume)
+                for _, pos, volume in pending
+            ),
+            return_exceptions=True
+        )
 
-            # Partial close request
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": pos.symbol,
-                "volume": volume,  # Partial volume
-                "type": close_type,
-                "position": ticket,
-                "price": close_price,
-                "deviation": 20,
-                "magic": 234000,
-                "comment": f"Partial close ({volume} lots)",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": filling_mode,
-            }
+        for (position_id, _, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error partially closing position %s: %s", position_id, outcome)
+                outcome = False
+            results[position_id] = outcome
 
-            result = mt5.order_send(request)
+        return results
 
-            if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
-                error = result.comment if result else mt5.last_error()
-                logger.error(f"Failed to partially close position {position_id}: {error}")
-                return False
+    def _close_open_position_partial(self, pos: Any, volume: float) -> bool:
+        """
+        Send a partial close request for a position record.
 
-            logger.info(
-                f"Partially closed {volume} lots of position {position_id} "
-                f"(remaining: {pos.volume - volume})"
+        Args:
+            pos: MT5 position record as returned by positions_get()
+            volume: Volume to close (partial)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        position_id = pos.ticket
+
+        # Validate volume
+        if volume > pos.volume:
+            logger.error(
+                "Cannot close %s lots, position only has %s lots", volume, pos.volume
             )
-            return True
+            return False
 
-        except Exception as e:
-            logger.error(f"Error partially closing position {position_id}: {e}")
+        # Determine closing type (opposite of opening)
+        is_buy = pos.type == self._type_buy
+        close_type = self._type_sell if is_buy else self._type_buy
+
+        # Get current price
+        tick = self._fresh_tick(pos.symbol)
+        if tick is None:
+            logger.error("Failed to get tick for %s", pos.symbol)
             return False
 
+        close_price = tick.bid if is_buy else tick.ask
+
+        filling_mode = self._resolve_filling_mode(pos.symbol)
+
+        # Partial close request
+        request = {
+            **self._close_template,
+            "symbol": pos.symbol,
+            "volume": volume,  # Partial volume
+            "type": close_type,
+            "position": position_id,
+            "price": close_price,
+            "comment": f"Partial close ({volume} lots)",
+            "type_filling": filling_mode,
+        }
+
+        result = self._mt5_call("order_send", request)
+
+        if result is None or result.retcode != self._retcode_done:
+            error = result.comment if result else self._mt5_call("last_error")
+            logger.error("Failed to partially close position %s: %s", position_id, error)
+            return False
+
+        logger.info(
+            "Partially closed %s lots of position %s "
+            "(remaining: %s)",
+            volume, position_id, pos.volume - volume
+        )
+        return True
+
     def modify_position_sl(
         self, 
         position_id: str, 
@@ -581,66 +1242,93 @@ class MT5Backend(TradingBackend):
         if not self._initialized or not self._mt5:
             logger.error("MT5 backend not initialized")
             return False
+        if not self._ensure_connected():
+            return False
 
         try:
             ticket = int(position_id)
-            mt5 = self._mt5
 
             # Get position info
-            position = mt5.positions_get(ticket=ticket)
-            if not position:
-                logger.error(f"Position {position_id} not found")
+            pos = self._get_position(ticket)
+            if pos is None:
+                logger.error("Position %s not found", position_id)
                 return False
 
-            pos = position[0]
-
             # Modification request
             request = {
-                "action": mt5.TRADE_ACTION_SLTP,
+                "action": self._action_sltp,
                 "position": ticket,
                 "symbol": pos.symbol,
                 "sl": float(new_sl),
                 "tp": pos.tp,  # Keep existing TP
             }
 
-            result = mt5.order_send(request)
+            result = self._mt5_call("order_send", request)
 
-            if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
-                error = result.comment if result else mt5.last_error()
-                logger.error(f"Failed to modify SL for position {position_id}: {error}")
+            if result is None or result.retcode != self._retcode_done:
+                error = result.comment if result else self._mt5_call("last_error")
+                logger.error("Failed to modify SL for position %s: %s", position_id, error)
                 return False
 
-            logger.info(f"Modified SL for position {position_id} to {new_sl:.5f}")
+            logger.info("Modified SL for position %s to %.5f", position_id, new_sl)
             return True
 
         except Exception as e:
-            logger.error(f"Error modifying SL for position {position_id}: {e}")
+            logger.error("Error modifying SL for position %s: %s", position_id, e)
             return False
 
-    def get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current market price for a symbol."""
+    def get_current_price(self, symbol: str, fresh: bool = False) -> Optional[float]:
+        """
+        Get current market price for a symbol.
+
+        Args:
+            symbol: Symbol name
+            fresh: Bypass the tick cache and query the terminal
+
+        Returns:
+            Current bid price or None if unavailable
+        """
         if not self._initialized or not self._mt5:
             logger.warning("MT5 backend not initialized")
             return None
+        if not self._ensure_connected():
+            return None
 
         try:
             # Find the actual symbol name
             actual_symbol = self.find_symbol(symbol)
             if actual_symbol is None:
-                logger.error(f"Symbol {symbol} not found in MT5")
+                logger.error("Symbol %s not found in MT5", symbol)
                 return None
             
-            tick = self._mt5.symbol_info_tick(actual_symbol)
+            # Repeat reads within the tick age are served from the tick cache
+            tick = self._fresh_tick(actual_symbol, fresh=fresh)
             if tick is None:
-                logger.error(f"Failed to get tick for {actual_symbol}")
+                logger.error("Failed to get tick for %s", actual_symbol)
                 return None
 
             return tick.bid
 
         except Exception as e:
-            logger.error(f"Error getting price for {symbol}: {e}")
+            logger.error("Error getting price for %s: %s", symbol, e)
             return None
 
+    async def get_account_info_async(self) -> Optional[AccountInfo]:
+        """Get MT5 account information without blocking the event loop."""
+        return await self._run_blocking(self.get_account_info)
+
+    async def get_positions_async(self) -> List[Position]:
+        """Get all open positions without blocking the event loop."""
+        return await self._run_blocking(self.get_positions)
+
+    async def close_position_async(self, position_id: str) -> bool:
+        """Close a position without blocking the event loop."""
+        return await self._run_blocking(self.close_position, position_id)
+
+    async def get_current_price_async(self, symbol: str) -> Optional[float]:
+        """Get current market price without blocking the event loop."""
+        return await self._run_blocking(self.get_current_price, symbol)
+
     def get_available_symbols(self) -> List[str]:
         """
         Get list of all available symbols in MT5.
@@ -652,20 +1340,44 @@ class MT5Backend(TradingBackend):
             logger.warning("MT5 backend not initialized")
             return []
 
+        return list(self._get_symbol_names())
+
+    def _get_symbol_names(self) -> List[str]:
+        """
+        Get all broker symbol names, served from cache while fresh.
+
+        The returned list is shared with the cache and must not be modified.
+
+        Returns:
+            List of symbol names (empty if the terminal call failed)
+        """
+        now = time.monotonic()
+        if self._symbols_cache is not None and now - self._symbols_cache[1] < self.SYMBOLS_TTL:
+            return self._symbols_cache[0]
+
         try:
-            symbols = self._mt5.symbols_get()
+            symbols = self._mt5_call("symbols_get")
             if symbols is None:
                 logger.error("Failed to get symbols from MT5")
                 return []
 
             symbol_names = [sym.name for sym in symbols]
-            logger.info(f"Found {len(symbol_names)} symbols in MT5")
-            return symbol_names
+            logger.info("Found %s symbols in MT5", len(symbol_names))
 
         except Exception as e:
-            logger.error(f"Error getting symbols: {e}")
+            logger.error("Error getting symbols: %s", e)
             return []
 
+        self._symbols_cache = (symbol_names, now)
+        self._symbols_set = frozenset(symbol_names)
+        # Reversed so the first of several case-variants wins, as in a linear scan
+        self._symbols_upper = {name.upper(): name for name in reversed(symbol_names)}
+        by_prefix3: Dict[str, List[str]] = {}
+        for name in symbol_names:
+            by_prefix3.setdefault(name[:3].upper(), []).append(name)
+        self._symbols_by_prefix3 = by_prefix3
+        return symbol_names
+
     def find_symbol(self, symbol: str) -> Optional[str]:
         """
         Find a symbol in MT5, trying various formats.
@@ -680,57 +1392,92 @@ class MT5Backend(TradingBackend):
             logger.warning("MT5 backend not initialized")
             return None
 
-        try:
-            # First, try exact match
-            sym_info = self._mt5.symbol_info(symbol)
-            if sym_info is not None:
-                return symbol
-
-            # Get all available symbols
-            all_symbols = self.get_available_symbols()
-            
-            # Try case-insensitive match
-            symbol_upper = symbol.upper()
-            for sym in all_symbols:
-                if sym.upper() == symbol_upper:
-                    logger.info(f"Found symbol match: {symbol} -> {sym}")
-                    return sym
-            
-            # Try partial match (e.g., XAUUSD might be XAUUSD_o or XAUUSDm)
-            for sym in all_symbols:
-                if sym.upper().startswith(symbol_upper):
-                    logger.info(f"Found symbol with prefix: {symbol} -> {sym}")
-                    return sym
-            
-            # Try common broker-specific variations
-            variations = [
-                f"{symbol}_o",  # Common suffix for some brokers
-                f"{symbol}m",   # Mini lot
-                f"{symbol}.a",  # Suffix
-                f"{symbol}.b",
-                f"{symbol}.c",
-                f"#{symbol}",   # Some brokers use # for stocks
-                f"{symbol}i",   # Another common suffix
-            ]
-            
-            for variation in variations:
-                sym_info = self._mt5.symbol_info(variation)
-                if sym_info is not None:
-                    logger.info(f"Found symbol variation: {symbol} -> {variation}")
-                    return variation
-            
-            # Log available symbols that might be related
-            related = [s for s in all_symbols if symbol[:3].upper() in s.upper()]
-            if related:
-                logger.warning(
-                    f"Symbol '{symbol}' not found. Similar symbols available: {', '.join(related[:10])}"
-                )
-            else:
-                logger.error(f"Symbol '{symbol}' not found in MT5. No similar symbols found.")
-            
-            return None
+        now = time.monotonic()
+        cached = self._symbol_alias_cache.get(symbol)
+        if cached is not None:
+            resolved, resolved_at = cached
+            if resolved is not None or now - resolved_at < self.SYMBOL_MISS_TTL:
+                return resolved
 
+        try:
+            resolved = self._resolve_symbol(symbol)
         except Exception as e:
-            logger.error(f"Error finding symbol {symbol}: {e}")
+            logger.error("Error finding symbol %s: %s", symbol, e)
             return None
 
+        self._symbol_alias_cache[symbol] = (resolved, now)
+        return resolved
+
+    def _resolve_symbol(self, symbol: str) -> Optional[str]:
+        """
+        Resolve a symbol name against the terminal, bypassing the alias cache.
+
+        Args:
+            symbol: Symbol to search for
+
+        Returns:
+            The actual symbol name in MT5, or None if not found
+        """
+        # First, try exact match
+        sym_info = self._get_symbol_info(symbol)
+        if sym_info is not None:
+            return symbol
+
+        # Get all available symbols
+        all_symbols = self._get_symbol_names()
+        
+        # Try case-insensitive match
+        symbol_upper = symbol.upper()
+        sym = self._symbols_upper.get(symbol_upper)
+        if sym is not None:
+            logger.info("Found symbol match: %s -> %s", symbol, sym)
+            return sym
+        
+        # Try partial match (e.g., XAUUSD might be XAUUSD_o or XAUUSDm);
+        # names shorter than the index key fall back to a full scan
+        if len(symbol_upper) >= 3:
+            candidates = self._symbols_by_prefix3.get(symbol_upper[:3], ())
+        else:
+            candidates = all_symbols
+        for sym in candidates:
+            if sym.upper().startswith(symbol_upper):
+                logger.info("Found symbol with prefix: %s -> %s", symbol, sym)
+                return sym
+        
+        # Try common broker-specific variations
+        variations = chain(
+            (symbol + suffix for suffix in self._SYMBOL_SUFFIXES),
+            (prefix + symbol for prefix in self._SYMBOL_PREFIXES),
+        )
+        
+        # Check against the cached symbol list; probe the terminal per
+        # variation only if the list could not be fetched
+        symbols_set = self._symbols_set
+        for variation in variations:
+            if symbols_set:
+                found = variation in symbols_set
+            else:
+                found = self._get_symbol_info(variation) is not None
+            if found:
+                logger.info("Found symbol variation: %s -> %s", symbol, variation)
+                return variation
+        
+        # Try known alternative names (e.g., GOLD for XAUUSD)
+        for alias in self._SYMBOL_ALIASES.get(symbol_upper, ()):
+            sym = self._symbols_upper.get(alias)
+            if sym is not None:
+                logger.info("Found symbol alias: %s -> %s", symbol, sym)
+                return sym
+        
+        # Log available symbols that might be related
+        related = list(islice(self._symbols_by_prefix3.get(symbol_upper[:3], ()), 10))
+        if related:
+            logger.warning(
+                "Symbol '%s' not found. Similar symbols available: %s",
+                symbol, ', '.join(related)
+            )
+        else:
+            logger.error("Symbol '%s' not found in MT5. No similar symbols found.", symbol)
+        
+        return None
+
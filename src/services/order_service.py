@@ -1,6 +1,6 @@
 """Order management service - converts signals to orders and manages execution."""
+import logging
 from typing import Optional
-from decimal import Decimal
 
 from src.domain.models import Signal, Order, TradeSide, OrderType
 from src.services.risk_manager import RiskManager
@@ -44,29 +44,21 @@ class OrderService:
         order_type, price = self._determine_order_type_and_price(signal)
 
         # Calculate position size
-        entry_price_float = float(price) if price else None
-        stop_loss_float = float(signal.stop_loss) if signal.stop_loss else None
-
         volume = self.risk_manager.calculate_position_size(
-            entry_price=entry_price_float,
-            stop_loss=stop_loss_float,
+            entry_price=price,
+            stop_loss=signal.stop_loss,
             pip_value=self.config.pip_size
         )
 
-        # Extract take profit levels
-        take_profits = [
-            float(tp) for tp in signal.take_profits if tp is not None
-        ]
-
         # Create order
         order = Order(
             symbol=signal.symbol,
             side=signal.side,
             order_type=order_type,
             volume=volume,
-            price=entry_price_float,
-            stop_loss=stop_loss_float,
-            take_profits=take_profits,
+            price=price,
+            stop_loss=signal.stop_loss,
+            take_profits=signal.get_take_profit_prices(),
             metadata={
                 'signal_timestamp': signal.timestamp.isoformat(),
                 'pip_count': signal.pip_count,
@@ -77,12 +69,12 @@ class OrderService:
         # Validate order
         is_valid, error = self.risk_manager.validate_order(order)
         if not is_valid:
-            logger.error(f"Order validation failed: {error}")
+            logger.error("Order validation failed: %s", error)
             return None
 
         logger.info(
-            f"Created order: {order.symbol} {order.side.value} "
-            f"{order.volume:.2f} lots @ {order.price:.2f}"
+            "Created order: %s %s %.2f lots @ %.2f",
+            order.symbol, order.side.value, order.volume, order.price
         )
 
         return order
@@ -90,7 +82,7 @@ class OrderService:
     def _determine_order_type_and_price(
         self,
         signal: Signal
-    ) -> tuple[OrderType, Optional[Decimal]]:
+    ) -> tuple[OrderType, Optional[float]]:
         """
         Determine order type and price based on signal data.
 
@@ -147,7 +139,8 @@ class OrderService:
         """
         # In dry run mode, log but don't actually execute
         if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would execute order: {order.to_dict()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[DRY RUN] Would execute order: %s", order.to_dict())
             return False
 
         # Additional checks could be added here:
@@ -179,7 +172,7 @@ class OrderService:
             else:
                 order.stop_loss = order.price + sl_distance
 
-            logger.info(f"Auto-calculated stop loss: {order.stop_loss:.2f}")
+            logger.info("Auto-calculated stop loss: %.2f", order.stop_loss)
 
         # If no take profits, suggest based on risk-reward ratios
         if not order.take_profits and order.stop_loss:
@@ -188,7 +181,7 @@ class OrderService:
                 stop_loss=order.stop_loss,
                 side=order.side.value
             )
-            logger.info(f"Auto-calculated take profits: {order.take_profits}")
+            logger.info("Auto-calculated take profits: %s", order.take_profits)
 
         return order
 
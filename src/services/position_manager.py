@@ -1,4 +1,6 @@
 """Position manager for handling multiple take profit levels and stop loss adjustments."""
+import logging
+import time
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -9,7 +11,7 @@ from src.core.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedPosition:
     """A position with multiple TP levels and tracking."""
     position_id: str
@@ -17,16 +19,81 @@ class ManagedPosition:
     side: TradeSide
     entry_price: float
     initial_volume: float
-    remaining_volume: float
     stop_loss: float
     take_profits: List[float]
     tp_hit_count: int = 0
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.monotonic_ns)
     metadata: dict = field(default_factory=dict)
+    _tp_volumes: List[float] = field(init=False, repr=False)
+    _tp_count: int = field(init=False, repr=False)
+    _tp_trigger: float = field(init=False, repr=False)
+    _side_sign: float = field(init=False, repr=False)
+    _remaining_units: int = field(init=False, repr=False)
     
     # Volume percentages for each TP level
     TP_PERCENTAGES = [0.40, 0.30, 0.30]  # 40%, 30%, 30%
     
+    # Volumes are tracked in integer hundredths of a lot (the lot step)
+    LOT_UNITS = 100
+    
+    def __post_init__(self):
+        """Precompute per-level close volumes from the initial volume."""
+        units = round(self.initial_volume * self.LOT_UNITS)
+        self._remaining_units = units
+        # Whole lot steps per level, the last level taking the remainder, so
+        # the closes always add up to the full volume. A share too small for
+        # one lot step is rounded up rather than dropped, so a small position
+        # closes out at earlier TPs and never has an empty level ahead of a
+        # non-empty one.
+        level_units = []
+        allotted = 0
+        for pct in self.TP_PERCENTAGES[:-1]:
+            share = min(max(round(units * pct), 1), units - allotted)
+            level_units.append(share)
+            allotted += share
+        level_units.append(units - allotted)
+        self._tp_volumes = [u / self.LOT_UNITS for u in level_units]
+        self._tp_count = len(self.take_profits)
+        # +1 for buys, -1 for sells: a TP is hit when (price - tp) * sign >= 0
+        self._side_sign = 1.0 if self.side == TradeSide.BUY else -1.0
+        self._refresh_tp_trigger()
+    
+    @property
+    def remaining_volume(self) -> float:
+        """Volume still open, in lots."""
+        return self._remaining_units / self.LOT_UNITS
+    
+    @remaining_volume.setter
+    def remaining_volume(self, volume: float) -> None:
+        self._remaining_units = round(volume * self.LOT_UNITS)
+    
+    @property
+    def is_closed(self) -> bool:
+        """Whether no volume remains open."""
+        return self._remaining_units <= 0
+    
+    @property
+    def created_at(self) -> datetime:
+        """Wall-clock creation time, derived from the monotonic timestamp."""
+        age = (time.monotonic_ns() - self.created_at_ns) / 1e9
+        return datetime.fromtimestamp(time.time() - age)
+    
+    def _refresh_tp_trigger(self) -> None:
+        """Cache the nearest pending TP price so no-hit checks are a single compare."""
+        pending = self.take_profits[self.tp_hit_count:]
+        if self.side == TradeSide.BUY:
+            self._tp_trigger = min(pending) if pending else float('inf')
+        else:
+            self._tp_trigger = max(pending) if pending else float('-inf')
+    
+    def is_tp_reachable(self, current_price: float) -> bool:
+        """Check whether the price reaches at least one pending TP level."""
+        return (current_price - self._tp_trigger) * self._side_sign >= 0.0
+    
+    def is_tp_hit(self, tp_price: float, current_price: float) -> bool:
+        """Check whether the price has reached a specific TP level."""
+        return (current_price - tp_price) * self._side_sign >= 0.0
+    
     def get_volume_for_tp_level(self, level: int) -> float:
         """
         Get the volume to close at a specific TP level.
@@ -35,12 +102,13 @@ class ManagedPosition:
             level: TP level (0-based index)
             
         Returns:
-            Volume to close
+            Volume to close, a whole number of lot steps; zero only for
+            levels after the whole position has been closed
         """
-        if level >= len(self.TP_PERCENTAGES):
+        if level >= len(self._tp_volumes):
             return self.remaining_volume
         
-        return self.initial_volume * self.TP_PERCENTAGES[level]
+        return self._tp_volumes[level]
     
     def get_next_stop_loss(self, tp_level: int) -> Optional[float]:
         """
@@ -62,7 +130,7 @@ class ManagedPosition:
             return self.entry_price
         elif tp_level == 1:
             # TP2 hit: Move SL to TP1
-            return self.take_profits[0] if len(self.take_profits) > 0 else self.entry_price
+            return self.take_profits[0] if self._tp_count > 0 else self.entry_price
         else:
             # TP3 hit: Close everything
             return None
@@ -70,6 +138,11 @@ class ManagedPosition:
     def mark_tp_hit(self, tp_level: int) -> None:
         """Mark a TP level as hit."""
         self.tp_hit_count = max(self.tp_hit_count, tp_level + 1)
+        self._refresh_tp_trigger()
+    
+    def reduce_volume(self, closed_volume: float) -> None:
+        """Subtract a closed volume from the remaining volume."""
+        self._remaining_units -= round(closed_volume * self.LOT_UNITS)
 
 
 class PositionManager:
@@ -78,12 +151,15 @@ class PositionManager:
     def __init__(self):
         """Initialize position manager."""
         self._positions: Dict[str, ManagedPosition] = {}
+        # Secondary index: symbol -> {position_id: position}
+        self._by_symbol: Dict[str, Dict[str, ManagedPosition]] = {}
     
     def add_position(
         self, 
         position_id: str, 
         order: Order,
-        actual_entry_price: float
+        actual_entry_price: float,
+        consume: bool = False
     ) -> ManagedPosition:
         """
         Add a new position to track.
@@ -92,32 +168,44 @@ class PositionManager:
             position_id: Unique position identifier
             order: The original order
             actual_entry_price: Actual filled entry price
+            consume: Take over the order's take-profit list and metadata
+                instead of copying them. The caller must not mutate the
+                order afterwards.
             
         Returns:
             ManagedPosition object
         """
+        if consume:
+            take_profits = order.take_profits
+            metadata = order.metadata
+        else:
+            take_profits = order.take_profits[:]  # Copy the list
+            metadata = order.metadata.copy()
+        
         managed_pos = ManagedPosition(
             position_id=position_id,
             symbol=order.symbol,
             side=order.side,
             entry_price=actual_entry_price,
             initial_volume=order.volume,
-            remaining_volume=order.volume,
             stop_loss=order.stop_loss or 0.0,
-            take_profits=order.take_profits[:],  # Copy the list
-            metadata=order.metadata.copy()
+            take_profits=take_profits,
+            metadata=metadata
         )
         
         self._positions[position_id] = managed_pos
+        self._by_symbol.setdefault(order.symbol, {})[position_id] = managed_pos
         
         logger.info(
-            f"Added managed position {position_id}: {order.symbol} "
-            f"{order.side.value.upper()} {order.volume} lots @ {actual_entry_price}"
+            "Added managed position %s: %s %s %s lots @ %s",
+            position_id, order.symbol, order.side.value.upper(), order.volume,
+            actual_entry_price
         )
         
-        if managed_pos.take_profits:
+        if managed_pos.take_profits and logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"  TP levels: {', '.join([f'TP{i+1}={tp:.5f}' for i, tp in enumerate(managed_pos.take_profits)])}"
+                "  TP levels: %s",
+                ', '.join([f'TP{i+1}={tp:.5f}' for i, tp in enumerate(managed_pos.take_profits)])
             )
         
         return managed_pos
@@ -128,9 +216,14 @@ class PositionManager:
     
     def remove_position(self, position_id: str) -> None:
         """Remove a position from tracking."""
-        if position_id in self._positions:
-            del self._positions[position_id]
-            logger.info(f"Removed managed position {position_id}")
+        managed_pos = self._positions.pop(position_id, None)
+        if managed_pos is not None:
+            by_symbol = self._by_symbol.get(managed_pos.symbol)
+            if by_symbol is not None:
+                by_symbol.pop(position_id, None)
+                if not by_symbol:
+                    del self._by_symbol[managed_pos.symbol]
+            logger.info("Removed managed position %s", position_id)
     
     def check_tp_hits(
         self, 
@@ -148,7 +241,7 @@ class PositionManager:
             List of (tp_level, tp_price, volume_to_close, new_sl) tuples
         """
         managed_pos = self._positions.get(position_id)
-        if not managed_pos:
+        if not managed_pos or not managed_pos.is_tp_reachable(current_price):
             return []
         
         actions = []
@@ -159,25 +252,50 @@ class PositionManager:
                 continue
             
             # Check if TP is hit
-            is_hit = False
-            if managed_pos.side == TradeSide.BUY:
-                is_hit = current_price >= tp_price
-            else:  # SELL
-                is_hit = current_price <= tp_price
-            
-            if is_hit:
+            if managed_pos.is_tp_hit(tp_price, current_price):
                 volume_to_close = managed_pos.get_volume_for_tp_level(tp_level)
+                if volume_to_close <= 0:
+                    # Earlier levels already close the whole position
+                    break
                 new_sl = managed_pos.get_next_stop_loss(tp_level)
                 
                 actions.append((tp_level, tp_price, volume_to_close, new_sl))
                 
                 logger.info(
-                    f"TP{tp_level + 1} hit for {position_id}: "
-                    f"Price {current_price:.5f} {'>=' if managed_pos.side == TradeSide.BUY else '<='} {tp_price:.5f}"
+                    "TP%d hit for %s: Price %.5f %s %.5f",
+                    tp_level + 1, position_id, current_price,
+                    '>=' if managed_pos.side == TradeSide.BUY else '<=', tp_price
                 )
         
         return actions
     
+    def check_tp_hits_bulk(
+        self,
+        symbol: str,
+        current_price: float
+    ) -> Dict[str, List[tuple]]:
+        """
+        Check TP levels for every tracked position in a symbol at once.
+        
+        Positions whose nearest pending TP is out of reach are rejected with a
+        single comparison, so a price update with no hits never walks the TP lists.
+        
+        Args:
+            symbol: Symbol the price update belongs to
+            current_price: Current market price
+            
+        Returns:
+            Dict of position_id -> list of (tp_level, tp_price, volume_to_close, new_sl)
+        """
+        hits = {}
+        for position_id, managed_pos in self._by_symbol.get(symbol, {}).items():
+            if not managed_pos.is_tp_reachable(current_price):
+                continue
+            actions = self.check_tp_hits(position_id, current_price)
+            if actions:
+                hits[position_id] = actions
+        return hits
+    
     def update_after_partial_close(
         self, 
         position_id: str, 
@@ -200,21 +318,23 @@ class PositionManager:
         
         # Update tracking
         managed_pos.mark_tp_hit(tp_level)
-        managed_pos.remaining_volume -= closed_volume
+        managed_pos.reduce_volume(closed_volume)
         
         if new_sl is not None:
             managed_pos.stop_loss = new_sl
             logger.info(
-                f"Updated {position_id}: TP{tp_level + 1} closed {closed_volume:.2f} lots, "
-                f"remaining {managed_pos.remaining_volume:.2f}, new SL: {new_sl:.5f}"
+                "Updated %s: TP%d closed %.2f lots, remaining %.2f, new SL: %.5f",
+                position_id, tp_level + 1, closed_volume,
+                managed_pos.remaining_volume, new_sl
             )
         else:
             logger.info(
-                f"Updated {position_id}: TP{tp_level + 1} closed {closed_volume:.2f} lots (final)"
+                "Updated %s: TP%d closed %.2f lots (final)",
+                position_id, tp_level + 1, closed_volume
             )
         
         # Remove if fully closed
-        if managed_pos.remaining_volume <= 0.001:  # Small tolerance
+        if managed_pos.is_closed:
             self.remove_position(position_id)
     
     def get_all_positions(self) -> List[ManagedPosition]:
@@ -223,4 +343,4 @@ class PositionManager:
     
     def get_positions_for_symbol(self, symbol: str) -> List[ManagedPosition]:
         """Get all positions for a specific symbol."""
-        return [pos for pos in self._positions.values() if pos.symbol == symbol]
+        return list(self._by_symbol.get(symbol, {}).values())
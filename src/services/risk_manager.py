@@ -1,5 +1,7 @@
 """Risk management service for position sizing and trade validation."""
-from typing import Optional, Tuple
+import logging
+from types import MappingProxyType
+from typing import List, Optional, Sequence, Tuple
 
 from src.domain.models import Order, Signal
 from src.core.config import TradingConfig
@@ -7,6 +9,15 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Standard pip values per lot for common symbols.
+# These are approximate and should be configured per broker.
+_PIP_VALUES = MappingProxyType({
+    'XAUUSD': 10.0,   # Gold: $10/pip per lot
+    'EURUSD': 10.0,   # EUR/USD: $10/pip per lot
+    'GBPUSD': 10.0,   # GBP/USD: $10/pip per lot
+    'USDJPY': 9.09,   # USD/JPY: ~$9.09/pip per lot (varies with rate)
+})
+
 
 class RiskManager:
     """
@@ -28,6 +39,8 @@ class RiskManager:
         self.min_volume = config.min_volume
         self.max_volume = config.max_volume
         self.default_volume = config.default_volume
+        # Sizing is done for the configured gold symbol, so resolve its pip value once
+        self._value_per_pip = self._get_pip_value_per_lot(config.symbol_xau)
 
     def calculate_position_size(
         self,
@@ -49,7 +62,7 @@ class RiskManager:
         if not entry_price or not stop_loss or entry_price == stop_loss:
             logger.warning(
                 "Cannot calculate position size: missing or invalid prices. "
-                f"Using default volume: {self.default_volume}"
+                "Using default volume: %s", self.default_volume
             )
             return self.default_volume
 
@@ -62,8 +75,8 @@ class RiskManager:
         # Prevent division by zero
         if sl_distance < 0.0001:
             logger.warning(
-                f"Stop loss too close to entry ({sl_distance:.5f}). "
-                f"Using default volume: {self.default_volume}"
+                "Stop loss too close to entry (%.5f). Using default volume: %s",
+                sl_distance, self.default_volume
             )
             return self.default_volume
 
@@ -72,8 +85,7 @@ class RiskManager:
 
         # Calculate position size
         # For XAUUSD: typically $10/pip per lot (varies by broker)
-        # This should be configurable per symbol
-        value_per_pip = self._get_pip_value_per_lot(symbol="XAUUSD")
+        value_per_pip = self._value_per_pip
 
         if value_per_pip <= 0:
             logger.warning("Invalid pip value. Using default volume.")
@@ -89,14 +101,60 @@ class RiskManager:
         position_size = round(position_size, 2)
 
         logger.info(
-            f"Position size calculated: {position_size:.2f} lots | "
-            f"Risk: ${risk_amount:.2f} | "
-            f"SL distance: {pip_distance:.1f} pips | "
-            f"Entry: {entry_price:.2f} | SL: {stop_loss:.2f}"
+            "Position size calculated: %.2f lots | Risk: $%.2f | "
+            "SL distance: %.1f pips | Entry: %.2f | SL: %.2f",
+            position_size, risk_amount, pip_distance, entry_price, stop_loss
         )
 
         return position_size
 
+    def calculate_position_sizes(
+        self,
+        entries: Sequence[Optional[float]],
+        stops: Sequence[Optional[float]],
+        pip_value: float = 0.01
+    ) -> List[float]:
+        """
+        Calculate position sizes for several entry/stop pairs at once.
+
+        Gives the same result per pair as calculate_position_size, but the
+        risk amount and pip value are resolved once and nothing is logged per
+        pair, which keeps sizing every leg of a TP ladder cheap.
+
+        Args:
+            entries: Entry prices
+            stops: Stop loss prices, aligned with entries
+            pip_value: Value of one pip for the symbol
+
+        Returns:
+            Position sizes in lots, one per pair
+        """
+        default = self.default_volume
+        value_per_pip = self._value_per_pip
+        if value_per_pip <= 0:
+            return [default] * len(entries)
+
+        risk_amount = self.account_balance * (self.risk_percent / 100)
+        min_volume = self.min_volume
+        max_volume = self.max_volume
+
+        sizes = []
+        for entry_price, stop_loss in zip(entries, stops):
+            if not entry_price or not stop_loss:
+                sizes.append(default)
+                continue
+
+            sl_distance = abs(entry_price - stop_loss)
+            if sl_distance < 0.0001:
+                sizes.append(default)
+                continue
+
+            pip_distance = sl_distance / pip_value
+            position_size = risk_amount / (pip_distance * value_per_pip)
+            sizes.append(round(max(min_volume, min(max_volume, position_size)), 2))
+
+        return sizes
+
     def validate_order(self, order: Order) -> Tuple[bool, Optional[str]]:
         """
         Validate if order meets risk management criteria.
@@ -107,31 +165,30 @@ class RiskManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check volume constraints
-        if order.volume < self.min_volume:
-            error = f"Volume {order.volume:.2f} below minimum {self.min_volume:.2f}"
-            logger.warning(error)
-            return False, error
-
-        if order.volume > self.max_volume:
-            error = f"Volume {order.volume:.2f} exceeds maximum {self.max_volume:.2f}"
+        # Check volume constraints; messages are only built on failure
+        volume = order.volume
+        if not self.min_volume <= volume <= self.max_volume:
+            if volume < self.min_volume:
+                error = f"Volume {volume:.2f} below minimum {self.min_volume:.2f}"
+            else:
+                error = f"Volume {volume:.2f} exceeds maximum {self.max_volume:.2f}"
             logger.warning(error)
             return False, error
 
-        # Check if stop loss is set (recommended but not required)
-        if not order.stop_loss:
+        stop_loss = order.stop_loss
+        if not stop_loss:
+            # Stop loss is recommended but not required
             logger.warning("Order has no stop loss - high risk!")
-
-        # Check if stop loss is reasonable
-        if order.price and order.stop_loss:
-            sl_distance_percent = abs(order.price - order.stop_loss) / order.price * 100
+        elif order.price and logger.isEnabledFor(logging.WARNING):
+            # The distance check only produces a warning, so skip it when muted
+            sl_distance_percent = abs(order.price - stop_loss) / order.price * 100
             if sl_distance_percent > 10:  # More than 10% away
                 logger.warning(
-                    f"Stop loss is {sl_distance_percent:.1f}% away from entry - "
-                    "unusually large risk!"
+                    "Stop loss is %.1f%% away from entry - unusually large risk!",
+                    sl_distance_percent
                 )
 
-        logger.info(f"Order validation passed: {order.symbol} {order.side.value}")
+        logger.info("Order validation passed: %s %s", order.symbol, order.side.value)
         return True, None
 
     def calculate_risk_reward_ratio(
@@ -181,20 +238,12 @@ class RiskManager:
         if ratios is None:
             ratios = [1.0, 2.0, 3.0, 4.0]
 
-        risk = abs(entry_price - stop_loss)
-        take_profits = []
-
-        for ratio in ratios:
-            reward = risk * ratio
+        # Resolve the direction once instead of per ratio
+        signed_risk = abs(entry_price - stop_loss)
+        if side.lower() != 'buy':  # sell
+            signed_risk = -signed_risk
 
-            if side.lower() == 'buy':
-                tp = entry_price + reward
-            else:  # sell
-                tp = entry_price - reward
-
-            take_profits.append(round(tp, 2))
-
-        return take_profits
+        return [round(entry_price + signed_risk * ratio, 2) for ratio in ratios]
 
     def _get_pip_value_per_lot(self, symbol: str) -> float:
         """
@@ -208,16 +257,7 @@ class RiskManager:
         Returns:
             Pip value per lot in account currency
         """
-        # Standard values for common symbols
-        # These are approximate and should be configured per broker
-        pip_values = {
-            'XAUUSD': 10.0,   # Gold: $10/pip per lot
-            'EURUSD': 10.0,   # EUR/USD: $10/pip per lot
-            'GBPUSD': 10.0,   # GBP/USD: $10/pip per lot
-            'USDJPY': 9.09,   # USD/JPY: ~$9.09/pip per lot (varies with rate)
-        }
-
-        return pip_values.get(symbol, 10.0)
+        return _PIP_VALUES.get(symbol, 10.0)
 
     def update_account_balance(self, new_balance: float) -> None:
         """
@@ -228,5 +268,5 @@ class RiskManager:
         """
         old_balance = self.account_balance
         self.account_balance = new_balance
-        logger.info(f"Account balance updated: ${old_balance:.2f} -> ${new_balance:.2f}")
+        logger.info("Account balance updated: $%.2f -> $%.2f", old_balance, new_balance)
 
@@ -1,13 +1,94 @@
 """Signal parsing service - extracts trading signals from Telegram messages."""
 import re
-from decimal import Decimal
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
 from typing import Optional
 
 from src.domain.models import Signal, TradeSide
 from src.core.logging import get_logger
 
+try:
+    # Optional google-re2: linear-time DFA matching for the fused pattern
+    import re2 as _re
+except ImportError:
+    _re = re
+
 logger = get_logger(__name__)
 
+_NUM = r'[0-9]+(?:\.[0-9]+)?'
+
+# Canonical symbol per named alternative, so aliases resolve from lastgroup
+_SYMBOL_GROUPS = {
+    'sym_xauusd': 'XAUUSD',
+    'sym_eurusd': 'EURUSD',
+    'sym_gbpusd': 'GBPUSD',
+    'sym_usdjpy': 'USDJPY',
+    'sym_btcusd': 'BTCUSD',
+    'sym_ethusd': 'ETHUSD',
+}
+
+# Side keyword -> enum, avoiding Enum value lookup per parse
+_SIDES = {'buy': TradeSide.BUY, 'sell': TradeSide.SELL}
+
+# Everything str.isspace() accepts, spelled out: re2's \s is ASCII-only, and
+# Telegram/Persian messages often put NBSP or narrow NBSP between fields
+_SPACE = '\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_WS = f'[{_SPACE}]'
+
+# Every field pattern as one alternation so a message is scanned once.
+# Alternatives are tried in order at each position: ranges come before the
+# bare Buy/Sell keyword so "Buy now : a - b" is read as a range. The pattern
+# sticks to syntax that means the same in re and re2: inline flags, explicit
+# digit and space classes, no backreferences and no \b (ASCII-only in re2;
+# word boundaries are checked in Python instead, see _is_whole_word).
+_SIGNAL_PATTERN = '(?i)' + '|'.join((
+    r'(?:(?P<sym_xauusd>XAUUSD|GOLD|XAU)|(?P<sym_eurusd>EURUSD)'
+    r'|(?P<sym_gbpusd>GBPUSD)|(?P<sym_usdjpy>USDJPY)'
+    r'|(?P<sym_btcusd>BTCUSD)|(?P<sym_ethusd>ETHUSD))',
+    rf'Market{_WS}*price{_WS}*[:\-]{_WS}*(?P<market>{_NUM})',
+    # Entry format (e.g., "Entry 🟰4057.749")
+    rf'Entry{_WS}*[🟰:\-]{_WS}*(?P<entry>{_NUM})',
+    rf'Buy{_WS}*(?:now)?{_WS}*[:\-]{_WS}*(?P<buy_a>{_NUM}){_WS}*[-–]{_WS}*(?P<buy_b>{_NUM})',
+    rf'Sell{_WS}*(?:now)?{_WS}*[:\-]{_WS}*(?P<sell_a>{_NUM}){_WS}*[-–]{_WS}*(?P<sell_b>{_NUM})',
+    # Standard format (e.g., "Tp1: 2650.50")
+    rf'Tp(?P<tp_level>[1-4])[{_SPACE}:\-]*(?P<tp>{_NUM}|open)',
+    # Alternative format with emoji (e.g., "TP1 )🟰4069.117")
+    rf'TP(?P<tp_alt_level>[1-4]){_WS}*\)?{_WS}*[🟰:\-]{_WS}*(?P<tp_alt>{_NUM})',
+    # Accept SL, SI, or S[I|L] with optional emoji prefix
+    rf'[✖️]?{_WS}*(?P<sl_tag>S[LI]){_WS}*[:\-]?{_WS}*(?P<sl>{_NUM})',
+    r'(?P<side>Buy|Sell)',
+))
+_SIGNAL_RE = _re.compile(_SIGNAL_PATTERN)
+
+# Match kind -> group that must stand as a whole word for the match to count
+_WORD_TOKEN_GROUPS = {
+    kind: _SIGNAL_RE.groupindex[group]
+    for kind, group in (
+        *((name, name) for name in _SYMBOL_GROUPS),
+        ('sl', 'sl_tag'),
+        ('side', 'side'),
+    )
+}
+
+# Pip counts usually trail a TP/SL value ("Tp1: 30 pips"), which the single
+# pass above has already consumed, so they get a scan of their own
+_PIP_PATTERN = f'(?i)([0-9]+){_WS}*pip'
+_PIP_RE = _re.compile(_PIP_PATTERN)
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Check text[start:end] has a Unicode word boundary on both sides, as re's \\b would."""
+    if start > 0:
+        ch = text[start - 1]
+        if ch.isalnum() or ch == '_':
+            return False
+    if end < len(text):
+        ch = text[end]
+        if ch.isalnum() or ch == '_':
+            return False
+    return True
+
 
 class SignalParser:
     """
@@ -19,18 +100,23 @@ class SignalParser:
     # Persian/Arabic digit translation table
     _digit_map = str.maketrans('۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩', '01234567890123456789')
 
-    # Symbol mappings
-    _symbol_map = {
-        'GOLD': 'XAUUSD',
-        'XAU': 'XAUUSD',
-    }
+    # Maximum number of distinct messages kept in the parse cache
+    PARSE_CACHE_SIZE = 2048
 
     def __init__(self):
         """Initialize the parser."""
-        pass
+        # Reposted/forwarded messages parse identically: normalized text -> Signal
+        self._parse_cache: OrderedDict = OrderedDict()
+        # Back-to-back duplicates skip even the LRU bookkeeping
+        self._last_key: Optional[str] = None
+        self._last_signal: Optional[Signal] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def normalize_digits(self, text: str) -> str:
         """Convert Persian/Arabic digits to Western digits."""
+        if text.isascii():
+            return text
         return text.translate(self._digit_map)
 
     def normalize_text(self, text: str) -> str:
@@ -46,12 +132,19 @@ class SignalParser:
         if not text:
             return ""
 
-        text = self.normalize_digits(text)
+        # Pure-ASCII messages have no Persian digits or keywords to rewrite
+        if text.isascii():
+            return text
+
+        text = text.translate(self._digit_map)
 
         # Normalize Persian/Arabic trading terms
-        text = text.replace('اسکلپ', 'scalp')
-        text = text.replace('خرید', 'Buy')
-        text = text.replace('فروش', 'Sell')
+        if 'اسکلپ' in text:
+            text = text.replace('اسکلپ', 'scalp')
+        if 'خرید' in text:
+            text = text.replace('خرید', 'Buy')
+        if 'فروش' in text:
+            text = text.replace('فروش', 'Sell')
 
         return text
 
@@ -59,37 +152,105 @@ class SignalParser:
         """
         Parse a signal from text message.
 
+        Messages that normalize to the same text are served from an LRU
+        cache; each call still returns its own Signal so callers may mutate
+        the result.
+
         Args:
             text: Raw message text
 
         Returns:
             Signal object with extracted information
         """
-        normalized_text = self.normalize_text(text)
-
-        signal = Signal(raw_message=text)
-
-        # Extract symbol
-        signal.symbol = self._extract_symbol(normalized_text)
-
-        # Extract market price
-        signal.market_price = self._extract_market_price(normalized_text)
+        key = self.normalize_text(text).strip()
+        if key == self._last_key:
+            self.cache_hits += 1
+            cached = self._last_signal
+        else:
+            cache = self._parse_cache
+            cached = cache.get(key)
+            if cached is None:
+                self.cache_misses += 1
+                cached = self._parse_uncached(key)
+                cache[key] = cached
+                if len(cache) > self.PARSE_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                self.cache_hits += 1
+                cache.move_to_end(key)
+            self._last_key = key
+            self._last_signal = cached
+
+        return replace(
+            cached,
+            raw_message=text,
+            take_profits=list(cached.take_profits),
+            timestamp=datetime.now()
+        )
+
+    def _parse_uncached(self, normalized_text: str) -> Signal:
+        """Run the regex scan and build a Signal for normalized text."""
+        signal = Signal(raw_message=normalized_text)
+
+        # Single pass over the text; the first occurrence of each field wins
+        found = {}
+        symbol = None
+        tp_std = {}
+        tp_alt = {}
+        for match in _SIGNAL_RE.finditer(normalized_text):
+            kind = match.lastgroup
+            token = _WORD_TOKEN_GROUPS.get(kind)
+            if token is not None and not _is_whole_word(normalized_text, *match.span(token)):
+                continue
+            if kind == 'tp':
+                tp_std.setdefault(match.group('tp_level'), match.group('tp'))
+            elif kind == 'tp_alt':
+                tp_alt.setdefault(match.group('tp_alt_level'), match.group('tp_alt'))
+            elif kind in _SYMBOL_GROUPS:
+                if symbol is None:
+                    symbol = _SYMBOL_GROUPS[kind]
+            elif kind not in found:
+                found[kind] = match
+
+        # Symbol was resolved to its canonical name during the scan
+        signal.symbol = symbol
+
+        # Extract market price, preferring the standard format over Entry
+        if 'market' in found:
+            signal.market_price = float(found['market'].group('market'))
+        elif 'entry' in found:
+            signal.market_price = float(found['entry'].group('entry'))
 
         # Extract buy/sell ranges
-        signal.buy_range = self._extract_buy_range(normalized_text)
-        signal.sell_range = self._extract_sell_range(normalized_text)
+        signal.buy_range = self._to_range(found.get('buy_b'), 'buy_a', 'buy_b')
+        signal.sell_range = self._to_range(found.get('sell_b'), 'sell_a', 'sell_b')
 
-        # Extract take profit levels
-        signal.take_profits = self._extract_take_profits(normalized_text)
+        # Extract take profit levels, preferring the standard format per level
+        take_profits = []
+        for level in '1234':
+            val = tp_std.get(level)
+            if val is None:
+                val = tp_alt.get(level)
+            if val is None or val.lower() == 'open':
+                take_profits.append(None)
+            else:
+                take_profits.append(float(val))
+        signal.take_profits = take_profits
 
         # Extract stop loss
-        signal.stop_loss = self._extract_stop_loss(normalized_text)
+        if 'sl' in found:
+            signal.stop_loss = float(found['sl'].group('sl'))
 
         # Extract pip count
-        signal.pip_count = self._extract_pip_count(normalized_text)
+        pip_match = _PIP_RE.search(normalized_text)
+        if pip_match:
+            signal.pip_count = int(pip_match.group(1))
 
         # Determine trade side
-        signal.side = self._determine_side(normalized_text, signal)
+        side_match = found.get('side')
+        signal.side = self._determine_side(
+            signal, side_match.group('side') if side_match else None
+        )
 
         if signal.is_valid():
             logger.info(f"Successfully parsed signal: {signal.symbol} {signal.side}")
@@ -98,109 +259,17 @@ class SignalParser:
 
         return signal
 
-    def _extract_symbol(self, text: str) -> Optional[str]:
-        """Extract trading symbol from text."""
-        # Support multiple common symbols
-        pattern = r'\b(XAUUSD|GOLD|XAU|EURUSD|GBPUSD|USDJPY|BTCUSD|ETHUSD)\b'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            symbol = match.group(1).upper()
-            return self._symbol_map.get(symbol, symbol)
-
-        return None
-
-    def _extract_market_price(self, text: str) -> Optional[Decimal]:
-        """Extract market price from text."""
-        # Try standard format first
-        pattern = r'Market\s*price\s*[:\-]\s*([0-9]+(?:\.[0-9]+)?)'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return Decimal(match.group(1))
-
-        # Try Entry format (e.g., "Entry 🟰4057.749")
-        pattern = r'Entry\s*[🟰:\-]\s*([0-9]+(?:\.[0-9]+)?)'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return Decimal(match.group(1))
-
-        return None
-
-    def _extract_buy_range(self, text: str) -> Optional[tuple]:
-        """Extract buy range from text."""
-        pattern = r'Buy\s*(?:now)?\s*[:\-]\s*([0-9]+(?:\.[0-9]+)?)\s*[-–]\s*([0-9]+(?:\.[0-9]+)?)'
-        match = re.search(pattern, text, re.IGNORECASE)
+    @staticmethod
+    def _to_range(match: Optional[re.Match], low: str, high: str) -> Optional[tuple]:
+        """Build an ordered (min, max) price range from a range match."""
+        if match is None:
+            return None
 
-        if match:
-            a = Decimal(match.group(1))
-            b = Decimal(match.group(2))
-            return (min(a, b), max(a, b))
-
-        return None
-
-    def _extract_sell_range(self, text: str) -> Optional[tuple]:
-        """Extract sell range from text."""
-        pattern = r'Sell\s*(?:now)?\s*[:\-]\s*([0-9]+(?:\.[0-9]+)?)\s*[-–]\s*([0-9]+(?:\.[0-9]+)?)'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            a = Decimal(match.group(1))
-            b = Decimal(match.group(2))
-            return (min(a, b), max(a, b))
-
-        return None
-
-    def _extract_take_profits(self, text: str) -> list:
-        """Extract take profit levels from text."""
-        take_profits = []
-
-        for i in range(1, 5):
-            # Try standard format first (e.g., "Tp1: 2650.50")
-            pattern = rf'Tp{i}[\s:\-]*([0-9]+(?:\.[0-9]+)?|open)'
-            match = re.search(pattern, text, re.IGNORECASE)
-
-            if match:
-                val = match.group(1).lower()
-                if val == 'open':
-                    take_profits.append(None)
-                else:
-                    take_profits.append(Decimal(val))
-            else:
-                # Try alternative format with emoji (e.g., "TP1 )🟰4069.117")
-                pattern = rf'TP{i}\s*\)?\s*[🟰:\-]\s*([0-9]+(?:\.[0-9]+)?)'
-                match = re.search(pattern, text, re.IGNORECASE)
-
-                if match:
-                    take_profits.append(Decimal(match.group(1)))
-                else:
-                    take_profits.append(None)
-
-        return take_profits
-
-    def _extract_stop_loss(self, text: str) -> Optional[Decimal]:
-        """Extract stop loss from text."""
-        # Accept SL, SI, or S[I|L] with optional emoji prefix
-        pattern = r'[✖️]?\s*\bS[LI]\b\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?)'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return Decimal(match.group(1))
-
-        return None
-
-    def _extract_pip_count(self, text: str) -> Optional[int]:
-        """Extract pip count from text."""
-        pattern = r'(\d+)\s*pip'
-        match = re.search(pattern, text, re.IGNORECASE)
-
-        if match:
-            return int(match.group(1))
-
-        return None
+        a = float(match.group(low))
+        b = float(match.group(high))
+        return (min(a, b), max(a, b))
 
-    def _determine_side(self, text: str, signal: Signal) -> Optional[TradeSide]:
+    def _determine_side(self, signal: Signal, keyword: Optional[str]) -> Optional[TradeSide]:
         """Determine trade side (buy/sell) from signal data."""
         # Prioritize range indicators
         if signal.sell_range:
@@ -208,10 +277,9 @@ class SignalParser:
         elif signal.buy_range:
             return TradeSide.BUY
 
-        # Fall back to keyword detection
-        match = re.search(r'\b(Buy|Sell)\b', text, re.IGNORECASE)
-        if match:
-            return TradeSide(match.group(1).lower())
+        # Fall back to the first Buy/Sell keyword in the message
+        if keyword:
+            return _SIDES[keyword.lower()]
 
         return None
 
@@ -1,21 +1,51 @@
 """Trading service - manages trading backend and order execution."""
-from typing import Optional
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from src.api.trading_backend import TradingBackend
 from src.infrastructure.trading.backends.ctrader_backend import CTraderBackend
 from src.infrastructure.trading.backends.mt5_backend import MT5Backend
-from src.domain.models import Order, AccountInfo
+from src.infrastructure.metrics.latency import LatencyTracker
+from src.domain.models import Order, AccountInfo, TradeSide
 from src.core.config import AppConfig
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Backend name -> (backend class, AppConfig attribute holding its config).
+# New backends register here instead of extending _initialize_backend.
+_BACKENDS: Dict[str, Tuple[Type[TradingBackend], str]] = {
+    "ctrader": (CTraderBackend, "ctrader"),
+    "mt5": (MT5Backend, "mt5"),
+}
+
 
 class TradingService:
     """
     High-level trading service that manages backend selection and order execution.
     """
 
+    # Orders submitted concurrently per batch, and the pause between batches
+    # to stay within broker rate limits
+    ORDER_BATCH_SIZE = 10
+    ORDER_BATCH_INTERVAL = 1.0
+
+    # Maximum number of symbols kept in the price cache
+    PRICE_CACHE_SIZE = 256
+
+    # Seconds account info is reused between fills
+    ACCOUNT_INFO_TTL = 5.0
+
+    # Warn when p99 order-to-ack latency exceeds this (microseconds)
+    ORDER_P99_ALERT_US = 500_000
+    # Minimum seconds between two latency degradation warnings
+    ORDER_P99_ALERT_INTERVAL = 60.0
+
     def __init__(self, config: AppConfig):
         """
         Initialize trading service.
@@ -24,30 +54,59 @@ class TradingService:
             config: Application configuration
         """
         self.config = config
-        self.backend: Optional[TradingBackend] = None
-        self._initialize_backend()
 
-    def _initialize_backend(self) -> None:
+        # symbol -> (price, monotonic expiry), least recently used first
+        self._price_cache: OrderedDict = OrderedDict()
+        self._price_lock = threading.RLock()
+
+        # (AccountInfo, monotonic fetch time); cleared whenever an order fills
+        # or an open position is closed or modified
+        self._account_info_cache: Optional[Tuple[AccountInfo, float]] = None
+
+        # Backend call latencies: 'order_to_ack' and 'market_data_delay'
+        self.latency = LatencyTracker()
+        # Monotonic time of the last latency warning, None before the first
+        self._latency_alerted_at: Optional[float] = None
+
+    @cached_property
+    def backend(self) -> TradingBackend:
+        """
+        Trading backend, created and connected on first use.
+
+        Deferring this keeps the broker handshake out of code paths that
+        never trade (tests, pure signal parsing).
+        """
+        return self._initialize_backend()
+
+    @cached_property
+    def _close_partial(self) -> Optional[Callable[[str, float], bool]]:
+        """Backend partial-close method, resolved once (None if unsupported)."""
+        return getattr(self.backend, 'close_position_partial', None)
+
+    @cached_property
+    def _modify_sl(self) -> Optional[Callable[[str, float], bool]]:
+        """Backend SL-modify method, resolved once (None if unsupported)."""
+        return getattr(self.backend, 'modify_position_sl', None)
+
+    def ensure_backend(self) -> TradingBackend:
+        """Create and connect the trading backend now if it is not already."""
+        return self.backend
+
+    def _initialize_backend(self) -> TradingBackend:
         """Initialize the appropriate trading backend based on configuration."""
         backend_name = self.config.trading.backend
 
-        if backend_name == "ctrader":
-            self.backend = CTraderBackend(
-                self.config.ctrader,
-                self.config.trading
-            )
-        elif backend_name == "mt5":
-            self.backend = MT5Backend(
-                self.config.mt5,
-                self.config.trading
-            )
-        else:
-            raise ValueError(f"Unknown trading backend: {backend_name}")
+        try:
+            backend_cls, config_attr = _BACKENDS[backend_name]
+        except KeyError:
+            raise ValueError(f"Unknown trading backend: {backend_name}") from None
+
+        backend = backend_cls(getattr(self.config, config_attr), self.config.trading)
 
         # Check availability
-        if not self.backend.is_available():
+        if not backend.is_available():
             logger.warning(
-                f"{backend_name} backend is not properly configured or available"
+                "%s backend is not properly configured or available", backend_name
             )
             if not self.config.trading.dry_run:
                 raise RuntimeError(
@@ -55,10 +114,12 @@ class TradingService:
                 )
         else:
             # Initialize backend
-            if self.backend.initialize():
-                logger.info(f"{backend_name} backend initialized successfully")
+            if backend.initialize():
+                logger.info("%s backend initialized successfully", backend_name)
             else:
-                logger.error(f"Failed to initialize {backend_name} backend")
+                logger.error("Failed to initialize %s backend", backend_name)
+
+        return backend
 
     def execute_order(self, order: Order) -> dict:
         """
@@ -73,49 +134,166 @@ class TradingService:
         if self.backend is None:
             raise RuntimeError("No trading backend available")
 
+        return self._place_order(order)
+
+    def execute_orders(self, orders: List[Order]) -> List[Any]:
+        """
+        Execute several orders concurrently through the trading backend.
+
+        BUY orders are submitted before SELL orders, in batches of
+        ORDER_BATCH_SIZE with ORDER_BATCH_INTERVAL seconds between batches.
+        A failed order does not cancel the others; its exception is returned
+        in place of the result.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            List of execution results (or exceptions), in the same order as orders
+        """
+        if self.backend is None:
+            raise RuntimeError("No trading backend available")
+
+        if not orders:
+            return []
+
+        # Stable sort keeps the original order within each side
+        queue = sorted(enumerate(orders), key=lambda item: item[1].side != TradeSide.BUY)
+        results: List[Any] = [None] * len(orders)
+        batch_size = self.ORDER_BATCH_SIZE
+
+        with ThreadPoolExecutor(
+            max_workers=min(batch_size, len(orders)),
+            thread_name_prefix="order"
+        ) as executor:
+            for start in range(0, len(queue), batch_size):
+                if start:
+                    time.sleep(self.ORDER_BATCH_INTERVAL)
+
+                batch = [
+                    (index, executor.submit(self._place_order, order))
+                    for index, order in queue[start:start + batch_size]
+                ]
+                for index, future in batch:
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = e
+
+        return results
+
+    async def execute_orders_async(self, orders: List[Order]) -> List[Any]:
+        """
+        Execute several orders without blocking the event loop.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            List of execution results (or exceptions), in the same order as orders
+        """
+        return await asyncio.to_thread(self.execute_orders, orders)
+
+    def _place_order(self, order: Order) -> dict:
+        """Send one order to the backend, logging the request and outcome."""
         try:
             logger.info(
-                f"Executing order: {order.symbol} {order.side.value} "
-                f"{order.volume:.2f} lots @ {order.price}"
+                "Executing order: %s %s %.2f lots @ %s",
+                order.symbol, order.side.value, order.volume, order.price
             )
 
+            start = time.perf_counter_ns()
             result = self.backend.place_order(order)
+            self.latency.record("order_to_ack", (time.perf_counter_ns() - start) // 1000)
+
+            # Balance and margin change on fills, so refetch on next use
+            self._account_info_cache = None
 
-            logger.info(f"Order execution result: {result}")
+            logger.info("Order execution result: %s", result)
+
+            self._check_order_latency()
             return result
 
         except Exception as e:
-            logger.error(f"Failed to execute order: {e}", exc_info=True)
+            logger.error("Failed to execute order: %s", e, exc_info=True)
             raise
 
+    def _check_order_latency(self) -> None:
+        """Warn when order p99 latency is degraded, at most once per alert interval."""
+        if not self.latency.is_p99_degraded("order_to_ack", self.ORDER_P99_ALERT_US):
+            return
+
+        now = time.monotonic()
+        last = self._latency_alerted_at
+        if last is not None and now - last < self.ORDER_P99_ALERT_INTERVAL:
+            return
+
+        self._latency_alerted_at = now
+        logger.warning(
+            "Order latency degraded: p99 %s us",
+            self.latency.percentile("order_to_ack", 99)
+        )
+
     def get_account_info(self) -> Optional[AccountInfo]:
         """
         Get current account information.
 
+        The last result is reused for ACCOUNT_INFO_TTL seconds unless an
+        order has been executed since.
+
         Returns:
             AccountInfo object or None if unavailable
         """
+        cached = self._account_info_cache
+        if cached is not None and time.monotonic() - cached[1] < self.ACCOUNT_INFO_TTL:
+            return cached[0]
+
         if self.backend is None:
             logger.warning("No trading backend available")
             return None
 
-        return self.backend.get_account_info()
+        account_info = self.backend.get_account_info()
+        if account_info is not None:
+            self._account_info_cache = (account_info, time.monotonic())
+        return account_info
 
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
         Get current market price for a symbol.
 
+        Prices are reused for price_cache_ttl_ms so repeated lookups while
+        handling one signal cost a single backend round-trip.
+
         Args:
             symbol: Trading symbol
 
         Returns:
             Current price or None if unavailable
         """
+        cache = self._price_cache
+        with self._price_lock:
+            entry = cache.get(symbol)
+            if entry is not None and time.monotonic() < entry[1]:
+                cache.move_to_end(symbol)
+                return entry[0]
+
         if self.backend is None:
             logger.warning("No trading backend available")
             return None
 
-        return self.backend.get_current_price(symbol)
+        start = time.perf_counter_ns()
+        price = self.backend.get_current_price(symbol)
+        self.latency.record("market_data_delay", (time.perf_counter_ns() - start) // 1000)
+
+        ttl_ms = self.config.trading.price_cache_ttl_ms
+        if price is not None and ttl_ms > 0:
+            with self._price_lock:
+                cache[symbol] = (price, time.monotonic() + ttl_ms / 1000)
+                cache.move_to_end(symbol)
+                if len(cache) > self.PRICE_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return price
 
     def close_position_partial(self, position_id: str, volume: float) -> bool:
         """
@@ -132,11 +310,16 @@ class TradingService:
             logger.warning("No trading backend available")
             return False
         
-        if hasattr(self.backend, 'close_position_partial'):
-            return self.backend.close_position_partial(position_id, volume)
-        else:
+        close_partial = self._close_partial
+        if close_partial is None:
             logger.warning("Backend does not support partial close")
             return False
+
+        closed = close_partial(position_id, volume)
+        if closed:
+            # Realized P&L changes balance and margin
+            self._account_info_cache = None
+        return closed
     
     def modify_position_sl(self, position_id: str, new_sl: float) -> bool:
         """
@@ -153,19 +336,47 @@ class TradingService:
             logger.warning("No trading backend available")
             return False
         
-        if hasattr(self.backend, 'modify_position_sl'):
-            return self.backend.modify_position_sl(position_id, new_sl)
-        else:
+        modify_sl = self._modify_sl
+        if modify_sl is None:
             logger.warning("Backend does not support SL modification")
             return False
 
+        modified = modify_sl(position_id, new_sl)
+        if modified:
+            # Margin requirements can follow the stop level
+            self._account_info_cache = None
+        return modified
+
     def is_backend_available(self) -> bool:
         """Check if trading backend is available and ready."""
         return self.backend is not None and self.backend.is_available()
 
-    def shutdown(self) -> None:
-        """Shutdown trading backend connection."""
-        if self.backend:
-            self.backend.shutdown()
+    def shutdown(self, timeout: float = 3.0) -> None:
+        """
+        Shutdown trading backend connection.
+
+        The backend is closed on a daemon thread so a broker that hangs on
+        disconnect cannot block process exit for longer than timeout.
+
+        Args:
+            timeout: Seconds to wait for the backend to close
+        """
+        stats = self.latency.get_stats()
+        if stats:
+            logger.info("Backend latency stats: %s", stats)
+
+        # Never create a backend just to shut it down
+        backend = self.__dict__.get('backend')
+        if backend is None:
+            return
+
+        thread = threading.Thread(
+            target=backend.shutdown, name="backend-shutdown", daemon=True
+        )
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Backend shutdown exceeded %.1fs; proceeding", timeout)
+        else:
             logger.info("Trading backend shut down")
 
@@ -3,6 +3,8 @@ Integration tests for backend switching functionality.
 Tests the ability to switch between cTrader and MT5 backends.
 """
 import os
+import threading
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 from src.services.trading_service import TradingService
@@ -24,6 +26,9 @@ class TestBackendSwitching:
         )
 
         service = TradingService(config)
+        assert 'backend' not in service.__dict__
+
+        assert service.ensure_backend() is service.backend
         assert service.backend is not None
         assert service.config.trading.backend == 'ctrader'
 
@@ -38,7 +43,7 @@ class TestBackendSwitching:
         )
 
         service = TradingService(config)
-        assert service.backend is not None
+        assert service.ensure_backend() is not None
         assert service.config.trading.backend == 'mt5'
 
     def test_backend_availability_check(self):
@@ -82,3 +87,144 @@ class TestBackendSwitching:
         assert result is not None
         assert result['status'] == 'dry_run'
 
+    def test_execute_orders_batch(self):
+        """Test that batched orders are submitted buys first and returned in input order."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        service.ORDER_BATCH_SIZE = 1
+        service.ORDER_BATCH_INTERVAL = 0.0
+
+        submitted = []
+
+        def place_order(order):
+            submitted.append(order.side)
+            if order.volume > 1:
+                raise RuntimeError("rejected")
+            return {'status': 'ok', 'side': order.side.value}
+
+        service.backend.place_order = place_order
+
+        orders = [
+            Order(symbol='XAUUSD', side=side, order_type=OrderType.MARKET, volume=volume)
+            for side, volume in (
+                (TradeSide.SELL, 0.01), (TradeSide.BUY, 0.01), (TradeSide.BUY, 2.0)
+            )
+        ]
+
+        results = service.execute_orders(orders)
+
+        assert submitted == [TradeSide.BUY, TradeSide.BUY, TradeSide.SELL]
+        assert results[0]['side'] == 'sell'
+        assert results[1]['side'] == 'buy'
+        assert isinstance(results[2], RuntimeError)
+
+    def test_current_price_is_cached(self):
+        """Test that repeated price lookups within the TTL reuse the backend quote."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True, price_cache_ttl_ms=60000),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        service.backend.get_current_price = MagicMock(return_value=2000.0)
+
+        assert service.get_current_price('XAUUSD') == 2000.0
+        assert service.get_current_price('XAUUSD') == 2000.0
+        assert service.backend.get_current_price.call_count == 1
+
+    def test_account_info_cached_until_order(self):
+        """Test that account info is reused until an order is executed."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        service.backend.get_account_info = MagicMock(return_value=MagicMock(balance=1000.0))
+
+        service.get_account_info()
+        service.get_account_info()
+        assert service.backend.get_account_info.call_count == 1
+
+        service.execute_order(Order(
+            symbol='XAUUSD', side=TradeSide.BUY, order_type=OrderType.MARKET, volume=0.01
+        ))
+        service.get_account_info()
+        assert service.backend.get_account_info.call_count == 2
+
+    def test_shutdown_does_not_wait_on_hung_backend(self):
+        """Test that a backend stuck in shutdown does not block the service."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        release = threading.Event()
+        service.backend.shutdown = lambda: release.wait(5)
+
+        started = time.monotonic()
+        service.shutdown(timeout=0.05)
+        release.set()
+
+        assert time.monotonic() - started < 1.0
+
+    def test_latency_warning_is_rate_limited(self):
+        """Test that a degraded p99 is reported once per alert interval."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        service.ORDER_P99_ALERT_US = 0
+
+        with patch('src.services.trading_service.logger') as mock_logger:
+            for _ in range(3):
+                service.execute_order(Order(
+                    symbol='XAUUSD', side=TradeSide.BUY, order_type=OrderType.MARKET, volume=0.01
+                ))
+
+        assert mock_logger.warning.call_count == 1
+
+    def test_account_info_refetched_after_position_changes(self):
+        """Test that partial closes and SL moves invalidate cached account info."""
+        config = AppConfig(
+            telegram=MagicMock(),
+            trading=TradingConfig(backend='ctrader', dry_run=True),
+            ctrader=CTraderConfig(rest_url='https://test.com', token='test123'),
+            mt5=MT5Config(),
+            logging=MagicMock()
+        )
+
+        service = TradingService(config)
+        service.backend.get_account_info = MagicMock(return_value=MagicMock(balance=1000.0))
+        service.backend.close_position_partial = MagicMock(return_value=True)
+        service.backend.modify_position_sl = MagicMock(return_value=True)
+
+        service.get_account_info()
+        service.close_position_partial('1', 0.01)
+        service.get_account_info()
+        service.modify_position_sl('1', 2000.0)
+        service.get_account_info()
+
+        assert service.backend.get_account_info.call_count == 3
@@ -1,5 +1,6 @@
 """Quick test to verify MT5 symbol mapping works correctly."""
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -49,14 +50,24 @@ def test_symbol_mapping():
     success_count = 0
     total_count = len(test_symbols)
     
-    for symbol, name in test_symbols.items():
+    # Fetch the terminal's symbol list once so lookups resolve locally
+    mt5_backend.get_available_symbols()
+    
+    def lookup(symbol):
         found = mt5_backend.find_symbol(symbol)
+        price = mt5_backend.get_current_price(symbol) if found else None
+        return symbol, found, price
+    
+    # Resolve all symbols concurrently, then report in the original order
+    with ThreadPoolExecutor(max_workers=len(test_symbols)) as executor:
+        results = list(executor.map(lookup, test_symbols))
+    
+    for symbol, found, price in results:
+        name = test_symbols[symbol]
         if found:
             print(f"✅ {symbol:10s} ({name:15s}) -> {found}")
             success_count += 1
             
-            # Try to get current price
-            price = mt5_backend.get_current_price(symbol)
             if price:
                 print(f"   💰 Current price: {price}")
         else:
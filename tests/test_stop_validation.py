@@ -1,21 +1,20 @@
 """Test stop loss and take profit validation."""
 import unittest
-from unittest.mock import Mock, MagicMock
+from types import SimpleNamespace
 
 
 class TestStopValidation(unittest.TestCase):
     """Test cases for stop level validation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock MetaTrader5 module
-        self.mt5_mock = Mock()
-        
-        # Create symbol info mock
-        self.symbol_info = Mock()
-        self.symbol_info.trade_stops_level = 10  # 10 points minimum
-        self.symbol_info.point = 0.00001  # 5 digits (e.g., EURUSD)
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared, read-only test fixtures."""
+        # Symbol info stand-in; no test mutates it, so build it once
+        cls.symbol_info = SimpleNamespace(
+            trade_stops_level=10,  # 10 points minimum
+            point=0.00001,  # 5 digits (e.g., EURUSD)
+        )
+
     def test_buy_order_sl_too_close(self):
         """Test BUY order with stop loss too close to entry."""
         # For BUY at 1.10000, SL must be <= 1.10000 - (10 * 0.00001) = 1.09990
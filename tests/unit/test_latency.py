@@ -0,0 +1,34 @@
+from src.infrastructure.metrics.latency import LatencyTracker
+
+
+def test_percentiles_from_histogram():
+    tracker = LatencyTracker(bucket_us=100, bucket_count=100)
+    for latency_us in range(0, 10000, 100):
+        tracker.record('order_to_ack', latency_us)
+
+    assert tracker.percentile('order_to_ack', 50) == 5000
+    assert tracker.percentile('order_to_ack', 99) == 9900
+    assert tracker.percentile('unknown', 50) is None
+
+
+def test_overflow_reports_max_and_degradation():
+    tracker = LatencyTracker(bucket_us=100, bucket_count=10)
+    tracker.record('order_to_ack', 50)
+    tracker.record('order_to_ack', 2_000_000)
+
+    stats = tracker.get_stats()['order_to_ack']
+    assert stats['count'] == 2
+    assert stats['p99_us'] == 2_000_000
+    assert tracker.is_p99_degraded('order_to_ack', threshold_us=500_000)
+    assert not tracker.is_p99_degraded('order_to_ack', threshold_us=3_000_000)
+
+
+def test_percentiles_recover_when_outliers_leave_window():
+    tracker = LatencyTracker(window_size=4, bucket_us=100, bucket_count=10)
+    tracker.record('order_to_ack', 2_000_000)
+    for _ in range(4):
+        tracker.record('order_to_ack', 50)
+
+    assert tracker.percentile('order_to_ack', 99) == 100
+    assert not tracker.is_p99_degraded('order_to_ack', threshold_us=500_000)
+    assert tracker.get_stats()['order_to_ack']['count'] == 5
@@ -0,0 +1,601 @@
+"""Test suite for MT5 backend using a fake MetaTrader5 module."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.trading.backends.mt5_backend import MT5Backend
+from src.core.config import MT5Config, TradingConfig
+from src.domain.models import Order, TradeSide, OrderType
+
+
+def make_fake_mt5():
+    """Create a fake MetaTrader5 module with the constants the backend uses."""
+    mt5 = MagicMock()
+    mt5.ORDER_TYPE_BUY = 0
+    mt5.ORDER_TYPE_SELL = 1
+    mt5.TRADE_ACTION_DEAL = 1
+    mt5.TRADE_ACTION_SLTP = 6
+    mt5.ORDER_TIME_GTC = 0
+    mt5.ORDER_FILLING_FOK = 0
+    mt5.ORDER_FILLING_IOC = 1
+    mt5.ORDER_FILLING_RETURN = 2
+    mt5.TRADE_RETCODE_DONE = 10009
+
+    mt5.symbol_info.return_value = SimpleNamespace(
+        name='XAUUSD', visible=True, trade_stops_level=0, point=0.01
+    )
+    mt5.symbol_info_tick.return_value = SimpleNamespace(bid=2000.0, ask=2000.5)
+    mt5.symbols_get.return_value = [SimpleNamespace(name='XAUUSD')]
+    mt5.order_send.return_value = SimpleNamespace(
+        retcode=10009, order=1, deal=2, volume=0.01, price=2000.5, comment='done'
+    )
+    return mt5
+
+
+@pytest.fixture
+def fake_mt5():
+    return make_fake_mt5()
+
+
+@pytest.fixture
+def backend(fake_mt5):
+    backend = MT5Backend(MT5Config(), TradingConfig(backend='mt5', dry_run=False))
+    backend._bind_mt5(fake_mt5)
+    backend._initialized = True
+    return backend
+
+
+def make_order(**kwargs):
+    params = dict(
+        symbol='XAUUSD',
+        side=TradeSide.BUY,
+        order_type=OrderType.MARKET,
+        volume=0.01,
+        price=2000.0,
+        stop_loss=1990.0,
+        take_profits=[2010.0],
+    )
+    params.update(kwargs)
+    return Order(**params)
+
+
+class TestPlaceOrder:
+    """Test cases for MT5Backend.place_order."""
+
+    def test_place_order_success(self, backend, fake_mt5):
+        """Test that a valid order is sent and reported as success."""
+        result = backend.place_order(make_order())
+
+        assert result['status'] == 'success'
+        request = fake_mt5.order_send.call_args[0][0]
+        assert request['symbol'] == 'XAUUSD'
+        assert request['sl'] == 1990.0
+        assert request['tp'] == 2010.0
+
+    def test_unset_stops_are_omitted(self, backend, fake_mt5):
+        """Test that the request carries no sl/tp keys when the order has none."""
+        backend.place_order(make_order(stop_loss=None, take_profits=[]))
+
+        request = fake_mt5.order_send.call_args[0][0]
+        assert 'sl' not in request
+        assert 'tp' not in request
+
+    def test_symbol_selected_once_per_session(self, backend, fake_mt5):
+        """Test that symbol visibility is only checked on the first trade."""
+        fake_mt5.symbol_info.return_value.visible = False
+        fake_mt5.symbol_select.return_value = True
+
+        backend.place_order(make_order())
+        backend.place_order(make_order())
+
+        assert fake_mt5.symbol_select.call_count == 1
+
+    def test_dry_run_serialises_order_once(self, backend, fake_mt5, monkeypatch):
+        """Test that the dry-run branch reuses one to_dict() result."""
+        backend.trading_config.dry_run = True
+        calls = []
+        original = Order.to_dict
+        monkeypatch.setattr(Order, 'to_dict', lambda self: calls.append(1) or original(self))
+
+        result = backend.place_order(make_order())
+
+        assert result['status'] == 'dry_run'
+        assert result['order']['symbol'] == 'XAUUSD'
+        assert len(calls) == 1
+        fake_mt5.order_send.assert_not_called()
+
+
+class TestGetPositions:
+    """Test cases for MT5Backend.get_positions."""
+
+    def test_unset_stops_become_none(self, backend, fake_mt5):
+        """Test that MT5's 0.0 placeholder for SL/TP maps to None."""
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(
+                symbol='XAUUSD', type=0, volume=0.1, price_open=2000.0,
+                price_current=2005.0, sl=0.0, tp=2010.0, ticket=42, profit=5.0
+            )
+        ]
+
+        positions = backend.get_positions()
+
+        assert len(positions) == 1
+        assert positions[0].side == TradeSide.BUY
+        assert positions[0].stop_loss is None
+        assert positions[0].take_profit == 2010.0
+        assert positions[0].position_id == '42'
+
+    def test_positions_soa(self, backend, fake_mt5):
+        """Test the per-field positions arrays used for vector comparisons."""
+        np = pytest.importorskip('numpy')
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(
+                symbol='XAUUSD', type=0, volume=0.1, price_open=2000.0,
+                price_current=2011.0, sl=0.0, tp=2010.0, ticket=1, profit=11.0
+            ),
+            SimpleNamespace(
+                symbol='EURUSD', type=1, volume=0.2, price_open=1.1,
+                price_current=1.09, sl=1.2, tp=1.0, ticket=2, profit=-2.5
+            ),
+        ]
+
+        soa = backend.get_positions_soa()
+
+        assert list(soa['current_prices'] >= soa['tps']) == [True, True]
+        assert soa['pnls'].sum() == 8.5
+        assert list(soa['symbols']) == ['XAUUSD', 'EURUSD']
+        assert soa['tickets'].dtype == np.int64
+        assert soa['pnls'].flags['C_CONTIGUOUS']
+
+
+class TestAsyncOrders:
+    """Test cases for the asyncio order placement helpers."""
+
+    def test_place_order_async(self, backend):
+        """Test that the coroutine wrapper returns the sync result."""
+        result = asyncio.run(backend.place_order_async(make_order()))
+        assert result['status'] == 'success'
+
+    def test_place_orders_keeps_failures_separate(self, backend, fake_mt5):
+        """Test that one failing order does not discard the others."""
+        orders = [make_order(), make_order(stop_loss=2100.0)]
+        results = asyncio.run(backend.place_orders(orders))
+
+        assert results[0]['status'] == 'success'
+        assert isinstance(results[1], ValueError)
+
+    def test_async_wrappers_use_worker_threads(self, backend):
+        """Test that async wrappers run on the backend's executor."""
+        backend._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5")
+        backend.get_current_price = lambda symbol: threading.current_thread().name
+
+        try:
+            name = asyncio.run(backend.get_current_price_async('XAUUSD'))
+        finally:
+            backend._executor.shutdown()
+
+        assert name.startswith('mt5')
+
+
+class TestSymbolInfoCache:
+    """Test cases for the symbol_info memoization."""
+
+    def test_symbol_info_served_from_cache(self, backend, fake_mt5):
+        """Test that repeat orders reuse the cached symbol info."""
+        backend.place_order(make_order())
+        backend.place_order(make_order())
+
+        assert fake_mt5.symbol_info.call_count == 1
+
+    def test_symbol_info_refetched_after_ttl(self, backend, fake_mt5):
+        """Test that stale entries are refreshed from the terminal."""
+        backend._get_symbol_info('XAUUSD')
+        symbol_info, fetched_at = backend._symbol_info_cache['XAUUSD']
+        backend._symbol_info_cache['XAUUSD'] = (
+            symbol_info, fetched_at - backend.SYMBOL_INFO_TTL - 1
+        )
+
+        backend._get_symbol_info('XAUUSD')
+
+        assert fake_mt5.symbol_info.call_count == 2
+
+    def test_symbol_select_invalidates_entry(self, backend, fake_mt5):
+        """Test that enabling a hidden symbol drops its cached record."""
+        fake_mt5.symbol_info.return_value.visible = False
+        fake_mt5.symbol_select.return_value = True
+
+        backend.place_order(make_order())
+        backend._get_symbol_info('XAUUSD')
+
+        assert fake_mt5.symbol_info.call_count == 2
+
+    def test_validation_reuses_fresh_symbol_info(self, backend, fake_mt5):
+        """Test that stop validation within the TTL does not re-fetch symbol info."""
+        backend._get_symbol_info('XAUUSD')
+
+        assert backend._validate_stops('XAUUSD', 0, 2000.0, 1990.0, 2010.0)
+        assert fake_mt5.symbol_info.call_count == 1
+
+    def test_validation_sees_widened_stops_level(self, backend, fake_mt5):
+        """Test that a stops level changed by the broker is checked after the TTL."""
+        backend._validate_stops('XAUUSD', 0, 2000.0, 1990.0, 2010.0)
+
+        fake_mt5.symbol_info.return_value = SimpleNamespace(
+            name='XAUUSD', visible=True, trade_stops_level=2000, point=0.01
+        )
+        symbol_info, fetched_at = backend._symbol_info_cache['XAUUSD']
+        backend._symbol_info_cache['XAUUSD'] = (
+            symbol_info, fetched_at - backend.SYMBOL_INFO_TTL - 1
+        )
+
+        with patch('src.infrastructure.trading.backends.mt5_backend.logger') as mock_logger:
+            backend._validate_stops('XAUUSD', 0, 2000.0, 1990.0, 2010.0)
+
+        assert fake_mt5.symbol_info.call_count == 2
+        assert "SL too close" in mock_logger.warning.call_args_list[0].args[0]
+
+    def test_filling_mode_resolved_once(self, backend):
+        """Test that the filling mode lookup is memoized per symbol."""
+        lookups = []
+        backend._symbol_cache = SimpleNamespace(
+            get_best_filling_mode=lambda symbol, preferred_mode: lookups.append(symbol) or 2
+        )
+
+        assert backend._resolve_filling_mode('XAUUSD') == 2
+        assert backend._resolve_filling_mode('XAUUSD') == 2
+        assert lookups == ['XAUUSD']
+
+    def test_validation_without_stops_skips_lookup(self, backend, fake_mt5):
+        """Test that an order without SL/TP needs no symbol info."""
+        assert backend._validate_stops('XAUUSD', 0, 2000.0, None, None)
+        fake_mt5.symbol_info.assert_not_called()
+
+    def test_side_checks_apply_without_symbol_info(self, backend, fake_mt5):
+        """Test that a wrong-side stop is rejected even if symbol info is missing."""
+        fake_mt5.symbol_info.return_value = None
+
+        assert backend._validate_stops('XAUUSD', 0, 2000.0, 2010.0, None) is False
+
+
+class TestTickCache:
+    """Test cases for the short-lived tick cache."""
+
+    def test_burst_reuses_tick(self, backend, fake_mt5):
+        """Test that back-to-back price reads share one terminal call."""
+        assert backend.get_current_price('XAUUSD') == 2000.0
+        assert backend.get_current_price('XAUUSD') == 2000.0
+
+        assert fake_mt5.symbol_info_tick.call_count == 1
+
+    def test_fresh_read_bypasses_cache(self, backend, fake_mt5):
+        """Test that fresh=True always queries the terminal."""
+        backend.get_current_price('XAUUSD')
+        backend.get_current_price('XAUUSD', fresh=True)
+
+        assert fake_mt5.symbol_info_tick.call_count == 2
+
+    def test_tick_age_is_configurable(self, backend, fake_mt5):
+        """Test that the default tick age comes from the MT5 config."""
+        backend.config.tick_max_age_ms = 0
+        backend._fresh_tick('XAUUSD')
+        backend._fresh_tick('XAUUSD')
+
+        assert fake_mt5.symbol_info_tick.call_count == 2
+
+    def test_price_reads_do_not_subscribe(self, backend, fake_mt5):
+        """Test that price reads use the tick cache without book subscriptions."""
+        backend.get_current_price('XAUUSD')
+        backend.shutdown()
+
+        fake_mt5.market_book_add.assert_not_called()
+        fake_mt5.market_book_release.assert_not_called()
+
+    def test_stale_tick_is_refreshed(self, backend, fake_mt5):
+        """Test that a tick older than the age limit is re-fetched."""
+        backend._fresh_tick('XAUUSD')
+        backend._fresh_tick('XAUUSD', max_age_ms=0)
+
+        assert fake_mt5.symbol_info_tick.call_count == 2
+
+
+class TestAvailability:
+    """Test cases for MetaTrader5 availability detection."""
+
+    def test_import_result_is_cached(self, monkeypatch):
+        """Test that the import probe runs only once per process."""
+        monkeypatch.setattr(MT5Backend, '_MT5_AVAILABLE', None)
+        monkeypatch.setattr(MT5Backend, '_MT5_MODULE', None)
+        backend = MT5Backend(MT5Config(), TradingConfig())
+
+        first = backend.is_available()
+        monkeypatch.setattr(MT5Backend, '_load_mt5', classmethod(lambda cls: pytest.fail()))
+
+        assert backend.is_available() is first
+
+    def test_availability_probe_does_not_import(self, monkeypatch):
+        """Test that is_available locates the package without importing it."""
+        monkeypatch.setattr(MT5Backend, '_MT5_AVAILABLE', None)
+        monkeypatch.setattr(MT5Backend, '_MT5_MODULE', None)
+        monkeypatch.setattr(
+            'importlib.util.find_spec',
+            lambda name: object() if name == 'MetaTrader5' else None
+        )
+        backend = MT5Backend(MT5Config(), TradingConfig())
+
+        assert backend.is_available() is True
+        assert MT5Backend._MT5_MODULE is None
+
+
+class TestClosePosition:
+    """Test cases for closing MT5 positions."""
+
+    def test_close_request_uses_template(self, backend, fake_mt5):
+        """Test that a close request carries the static fields and opposite side."""
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(symbol='XAUUSD', type=0, volume=0.1, ticket=42, tp=0.0)
+        ]
+
+        assert backend.close_position('42') is True
+
+        request = fake_mt5.order_send.call_args[0][0]
+        assert request['type'] == fake_mt5.ORDER_TYPE_SELL
+        assert request['position'] == 42
+        assert request['price'] == 2000.0
+        assert request['magic'] == 234000
+        assert request['comment'] == 'Close by bot'
+
+    def test_close_positions_prefetches_once(self, backend, fake_mt5):
+        """Test that a batch close makes one positions_get call for all tickets."""
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(symbol='XAUUSD', type=0, volume=0.1, ticket=1, tp=0.0),
+            SimpleNamespace(symbol='XAUUSD', type=1, volume=0.2, ticket=2, tp=0.0),
+        ]
+
+        results = asyncio.run(backend.close_positions(['1', '2', '3']))
+
+        assert results == {'1': True, '2': True, '3': False}
+        assert fake_mt5.positions_get.call_count == 1
+        assert fake_mt5.order_send.call_count == 2
+
+    def test_position_lookups_share_snapshot(self, backend, fake_mt5):
+        """Test that lookups reuse one positions table until a trade is sent."""
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(symbol='XAUUSD', type=0, volume=0.1, ticket=42, tp=0.0)
+        ]
+
+        assert backend._get_position(42) is not None
+        assert backend._get_position(7) is None
+        assert fake_mt5.positions_get.call_count == 1
+
+        backend.close_position('42')
+        backend._get_position(42)
+
+        assert fake_mt5.positions_get.call_count == 2
+
+    def test_close_positions_partial(self, backend, fake_mt5):
+        """Test that a TP ladder is partially closed with one position fetch."""
+        fake_mt5.positions_get.return_value = [
+            SimpleNamespace(symbol='XAUUSD', type=0, volume=0.3, ticket=1, tp=0.0),
+            SimpleNamespace(symbol='XAUUSD', type=1, volume=0.2, ticket=2, tp=0.0),
+        ]
+
+        results = asyncio.run(
+            backend.close_positions_partial([('1', 0.1), ('2', 0.5), ('3', 0.1)])
+        )
+
+        assert results == {'1': True, '2': False, '3': False}
+        assert fake_mt5.positions_get.call_count == 1
+        request = fake_mt5.order_send.call_args[0][0]
+        assert request['volume'] == 0.1
+        assert request['comment'] == 'Partial close (0.1 lots)'
+
+
+class TestConnectionHealth:
+    """Test cases for the terminal keepalive and reconnect logic."""
+
+    def test_healthy_session_skips_ping(self, backend, fake_mt5):
+        """Test that public calls do not ping the terminal themselves."""
+        backend.get_current_price('XAUUSD')
+
+        fake_mt5.terminal_info.assert_not_called()
+        fake_mt5.initialize.assert_not_called()
+
+    def test_lost_session_reconnects_before_call(self, backend, fake_mt5):
+        """Test that a session flagged as lost is re-opened on the next call."""
+        backend._connection_lost = True
+        fake_mt5.initialize.return_value = True
+
+        assert backend.get_current_price('XAUUSD') == 2000.0
+        assert backend._connection_lost is False
+        fake_mt5.initialize.assert_called_once()
+
+    def test_reconnect_backs_off_until_success(self, backend, fake_mt5, monkeypatch):
+        """Test that failed attempts are retried with a doubling delay."""
+        delays = []
+        monkeypatch.setattr(backend._health_stop, 'wait', lambda d: delays.append(d))
+        backend._connection_lost = True
+        fake_mt5.initialize.side_effect = [False, False, True]
+
+        assert backend._reconnect(attempts=5) is True
+        assert delays == [1.0, 2.0]
+
+    def test_health_check_reconnects_dead_terminal(self, fake_mt5):
+        """Test that the background ping restores a dropped session."""
+        config = MT5Config(keepalive_interval=0.01)
+        backend = MT5Backend(config, TradingConfig(backend='mt5', dry_run=False))
+        backend._bind_mt5(fake_mt5)
+        reconnected = threading.Event()
+        fake_mt5.terminal_info.return_value = None
+        fake_mt5.initialize.side_effect = lambda *a, **k: reconnected.set() or True
+
+        backend._start_health_check()
+        try:
+            assert reconnected.wait(timeout=2.0)
+        finally:
+            backend._stop_health_check()
+
+        assert backend._health_thread is None
+
+
+class TestFindSymbol:
+    """Test cases for broker symbol name resolution."""
+
+    def test_resolution_is_memoized(self, backend, fake_mt5):
+        """Test that a resolved alias is served without terminal calls."""
+        fake_mt5.symbol_info.side_effect = (
+            lambda name: fake_mt5.symbol_info.return_value if name == 'XAUUSDm' else None
+        )
+        fake_mt5.symbols_get.return_value = [SimpleNamespace(name='XAUUSDm')]
+
+        assert backend.find_symbol('XAUUSD') == 'XAUUSDm'
+        calls = fake_mt5.symbol_info.call_count
+        assert backend.find_symbol('XAUUSD') == 'XAUUSDm'
+
+        assert fake_mt5.symbol_info.call_count == calls
+
+    def test_misses_expire(self, backend, fake_mt5):
+        """Test that unknown names are re-resolved once the miss TTL passes."""
+        fake_mt5.symbol_info.return_value = None
+        fake_mt5.symbols_get.return_value = []
+
+        assert backend.find_symbol('NOPE') is None
+        calls = fake_mt5.symbol_info.call_count
+        assert backend.find_symbol('NOPE') is None
+        assert fake_mt5.symbol_info.call_count == calls
+
+        resolved, resolved_at = backend._symbol_alias_cache['NOPE']
+        backend._symbol_alias_cache['NOPE'] = (
+            resolved, resolved_at - backend.SYMBOL_MISS_TTL - 1
+        )
+        backend.find_symbol('NOPE')
+
+        assert fake_mt5.symbol_info.call_count > calls
+
+    def test_known_alias_is_resolved(self, backend, fake_mt5):
+        """Test that a broker naming gold GOLD still resolves XAUUSD."""
+        fake_mt5.symbol_info.return_value = None
+        fake_mt5.symbols_get.return_value = [SimpleNamespace(name='Gold')]
+
+        assert backend.find_symbol('XAUUSD') == 'Gold'
+
+    def test_symbol_list_is_cached(self, backend, fake_mt5):
+        """Test that the broker symbol list is fetched once per TTL window."""
+        fake_mt5.symbols_get.return_value = [
+            SimpleNamespace(name='XAUUSD'), SimpleNamespace(name='EURUSD.a')
+        ]
+
+        assert backend.get_available_symbols() == ['XAUUSD', 'EURUSD.a']
+        backend.get_available_symbols()
+
+        assert fake_mt5.symbols_get.call_count == 1
+
+    def test_case_insensitive_match_uses_index(self, backend, fake_mt5):
+        """Test that names differing only in case resolve via the upper index."""
+        fake_mt5.symbol_info.side_effect = lambda name: None
+        fake_mt5.symbols_get.return_value = [SimpleNamespace(name='EURUSD.a')]
+
+        assert backend.find_symbol('eurusd.A') == 'EURUSD.a'
+
+    def test_prefix_match_uses_index(self, backend, fake_mt5):
+        """Test that suffixed broker names are found through the prefix index."""
+        fake_mt5.symbol_info.side_effect = lambda name: None
+        fake_mt5.symbols_get.return_value = [
+            SimpleNamespace(name='EURUSD'), SimpleNamespace(name='xauusd_o')
+        ]
+
+        assert backend.find_symbol('XAUUSD') == 'xauusd_o'
+        assert backend._symbols_by_prefix3['XAU'] == ['xauusd_o']
+
+    def test_variations_checked_without_probes(self, backend, fake_mt5):
+        """Test that broker variations are matched against the cached list."""
+        fake_mt5.symbol_info.side_effect = lambda name: None
+        fake_mt5.symbols_get.return_value = [
+            SimpleNamespace(name='EURUSD'), SimpleNamespace(name='#AAPL')
+        ]
+
+        assert backend.find_symbol('AAPL') == '#AAPL'
+        assert fake_mt5.symbol_info.call_count == 1
+
+
+class TestTerminalFunnel:
+    """Test cases for routing terminal calls through one worker thread."""
+
+    @pytest.fixture
+    def funnel(self, backend):
+        backend._mt5_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5-io")
+        yield backend
+        backend._mt5_exec.shutdown()
+
+    def test_calls_run_on_terminal_thread(self, funnel, fake_mt5):
+        """Test that terminal calls execute on the dedicated thread."""
+        fake_mt5.order_send.side_effect = lambda request: threading.current_thread().name
+
+        assert funnel._mt5_call('order_send', {}).startswith('mt5-io')
+
+    def test_concurrent_identical_reads_coalesce(self, funnel, fake_mt5):
+        """Test that simultaneous identical reads share one terminal call."""
+        release = threading.Event()
+        fake_mt5.symbol_info_tick.side_effect = lambda symbol: release.wait() and symbol
+        lookups = threading.Semaphore(0)
+
+        class CountingLock:
+            def __init__(self):
+                self._lock = threading.Lock()
+
+            def __enter__(self):
+                self._lock.acquire()
+                lookups.release()
+
+            def __exit__(self, *exc):
+                self._lock.release()
+
+        funnel._inflight_lock = CountingLock()
+
+        with ThreadPoolExecutor(max_workers=2) as callers:
+            first = callers.submit(funnel._mt5_call, 'symbol_info_tick', 'XAUUSD')
+            second = callers.submit(funnel._mt5_call, 'symbol_info_tick', 'XAUUSD')
+            # Both callers have looked up the in-flight table before the read finishes
+            assert lookups.acquire(timeout=2.0) and lookups.acquire(timeout=2.0)
+            release.set()
+
+            assert first.result() == second.result() == 'XAUUSD'
+
+        assert fake_mt5.symbol_info_tick.call_count == 1
+        assert funnel._inflight == {}
+
+    def test_reads_do_not_coalesce_across_writes(self, funnel, fake_mt5):
+        """Test that a read queued after a write is not served by an earlier read."""
+        release = threading.Event()
+        tables = iter([['before'], ['after']])
+        fake_mt5.positions_get.side_effect = lambda: release.wait(2.0) and next(tables)
+
+        with ThreadPoolExecutor(max_workers=3) as callers:
+            first = callers.submit(funnel._mt5_call, 'positions_get')
+            while not funnel._inflight:
+                time.sleep(0.001)
+            write = callers.submit(funnel._mt5_call, 'order_send', {})
+            while funnel._inflight:
+                time.sleep(0.001)
+            second = callers.submit(funnel._mt5_call, 'positions_get')
+            release.set()
+
+            assert write.result() is not None
+            assert first.result() == ['before']
+            assert second.result() == ['after']
+
+    def test_write_invalidates_snapshots(self, backend, fake_mt5):
+        """Test that order_send drops cached positions and ticks."""
+        backend._get_open_positions()
+        backend._fresh_tick('XAUUSD')
+
+        backend._mt5_call('order_send', {})
+        backend._get_open_positions()
+        backend._fresh_tick('XAUUSD')
+
+        assert fake_mt5.positions_get.call_count == 2
+        assert fake_mt5.symbol_info_tick.call_count == 2
@@ -0,0 +1,44 @@
+"""Test suite for multi-TP position tracking."""
+import pytest
+from src.services.position_manager import PositionManager
+from src.domain.models import Order, TradeSide, OrderType
+
+
+def _track(manager, volume):
+    order = Order(
+        symbol="XAUUSD",
+        side=TradeSide.BUY,
+        order_type=OrderType.MARKET,
+        volume=volume,
+        stop_loss=2640.0,
+        take_profits=[2660.0, 2670.0, 2680.0],
+    )
+    return manager.add_position("1", order, 2650.0)
+
+
+class TestPositionManager:
+    """Test cases for PositionManager class."""
+
+    @pytest.mark.parametrize("volume", [0.01, 0.02, 0.05, 0.07, 1.0])
+    def test_tp_volumes_add_up_to_whole_lot_steps(self, volume):
+        """Test per-level closes are lot-step multiples covering the volume."""
+        managed_pos = _track(PositionManager(), volume)
+        volumes = [managed_pos.get_volume_for_tp_level(i) for i in range(3)]
+
+        assert all(round(v * 100) == pytest.approx(v * 100) for v in volumes)
+        assert sum(volumes) == pytest.approx(volume)
+        # Empty levels may only trail the ones that close the position
+        assert sorted(volumes, key=lambda v: v == 0) == volumes
+
+    def test_min_lot_position_closes_at_first_tp(self):
+        """Test a position too small to split is closed whole at TP1, not skipped."""
+        manager = PositionManager()
+        _track(manager, 0.01)
+
+        actions = manager.check_tp_hits("1", 2690.0)
+        assert [(level, volume) for level, _, volume, _ in actions] == [(0, 0.01)]
+
+        for tp_level, _, volume, new_sl in actions:
+            manager.update_after_partial_close("1", tp_level, volume, new_sl)
+
+        assert manager.get_position("1") is None
@@ -37,6 +37,20 @@ class TestRiskManager:
         assert position_size >= rm.min_volume
         assert position_size <= rm.max_volume
 
+    def test_batch_position_sizes_match_scalar(self):
+        """Test that batch sizing agrees with the scalar calculation per pair."""
+        config = TradingConfig(account_balance=10000.0, risk_percent=1.0, default_volume=0.05)
+        rm = RiskManager(config)
+
+        entries = [2000.0, 2000.0, 2000.0, 2000.0]
+        stops = [1990.0, 1999.9, None, 2000.0]
+        expected = [
+            rm.calculate_position_size(entry, stop, pip_value=0.1)
+            for entry, stop in zip(entries, stops)
+        ]
+
+        assert rm.calculate_position_sizes(entries, stops, pip_value=0.1) == expected
+
     def test_position_size_with_missing_sl(self):
         """Test that default volume is used when SL is missing."""
         config = TradingConfig(account_balance=10000.0, default_volume=0.05)
@@ -1,6 +1,9 @@
+import re
+import sys
+
 import pytest
+from src.services import signal_parser as signal_parser_module
 from src.services.signal_parser import SignalParser
-from decimal import Decimal
 
 parser = SignalParser()
 
@@ -23,17 +26,104 @@ Sl : 4101.50        ( 80 pip )
 '''
 
 
-def test_parse_sample():
-    signal = parser.parse(SAMPLE)
-    assert signal.symbol == 'XAUUSD'
-    assert signal.market_price == Decimal('4112')
-    assert signal.buy_range[0] == Decimal('4107')
-    assert signal.buy_range[1] == Decimal('4112')
-    assert signal.take_profits[0] == Decimal('4120')
-    assert signal.take_profits[1] == Decimal('4128')
-    assert signal.take_profits[2] == Decimal('4146')
-    assert signal.take_profits[3] is None
-    assert signal.stop_loss == Decimal('4101.50')
-    assert signal.pip_count == 80
-    assert signal.side.value == 'buy'
+@pytest.fixture(scope="module")
+def parsed_sample():
+    return parser.parse(SAMPLE)
+
+
+def test_parse_sample_symbol_and_side(parsed_sample):
+    assert parsed_sample.symbol == 'XAUUSD'
+    assert parsed_sample.side.value == 'buy'
+
+
+def test_parse_sample_entry(parsed_sample):
+    assert parsed_sample.market_price == 4112.0
+    assert parsed_sample.buy_range[0] == 4107.0
+    assert parsed_sample.buy_range[1] == 4112.0
+
+
+def test_parse_sample_take_profits(parsed_sample):
+    assert parsed_sample.take_profits[0] == 4120.0
+    assert parsed_sample.take_profits[1] == 4128.0
+    assert parsed_sample.take_profits[2] == 4146.0
+    assert parsed_sample.take_profits[3] is None
+
+
+def test_parse_sample_stop_loss(parsed_sample):
+    assert parsed_sample.stop_loss == 4101.5
+    assert parsed_sample.pip_count == 80
+
+
+def test_parse_cache_returns_independent_signals():
+    cached_parser = SignalParser()
+    first = cached_parser.parse(SAMPLE)
+    first.take_profits[0] = None
+    second = cached_parser.parse(SAMPLE)
+
+    assert second is not first
+    assert second.take_profits[0] == 4120.0
+    assert (cached_parser.cache_hits, cached_parser.cache_misses) == (1, 1)
+
+
+def test_parse_cache_keys_on_normalized_text():
+    cached_parser = SignalParser()
+    first = cached_parser.parse(SAMPLE)
+    second = cached_parser.parse("  " + SAMPLE + "\n")
+
+    assert second.take_profits == first.take_profits
+    assert second.raw_message == "  " + SAMPLE + "\n"
+    assert (cached_parser.cache_hits, cached_parser.cache_misses) == (1, 1)
+
+
+@pytest.mark.parametrize("text, pips", [
+    ("XAUUSD Buy\nTp1: 30 pips", 30),
+    ("XAUUSD Sell\nSL: 10 pip", 10),
+])
+def test_pip_count_after_tp_or_sl_value(text, pips):
+    assert parser.parse(text).pip_count == pips
+
+
+NBSP_SAMPLE = 'XAUUSD Buy\nTp1:\xa02660\nSL\xa0:\xa02640'
+
+# Messages exercising Unicode spaces, Persian text and word boundaries, where
+# re and re2 are most likely to disagree
+ENGINE_CORPUS = [
+    SAMPLE,
+    NBSP_SAMPLE,
+    'GOLD\u202fSell now\u202f:\u202f2650\u202f-\u202f2655\nTP1 )🟰2640\u3000\nSI : 2670',
+    'طلا XAUUSD فروش\nTp1 : ۲۶۴۰\nSl : ۲۶۷۰ ( ۳۰ pip )',
+    'طلاXAUUSD خرید ۲۶۵۰',
+    'XAUUSDT Buyer SL4101 ISL: 40',
+    'Entry 🟰4057.749\n✖️SL : 4050\nTP1 )🟰4069.117',
+]
+
+
+def test_space_class_matches_str_isspace():
+    everything = ''.join(map(chr, range(sys.maxunicode + 1)))
+    spaces = set(re.findall(signal_parser_module._WS, everything))
+
+    assert spaces == {ch for ch in everything if ch.isspace()}
+
+
+def test_parse_non_breaking_spaces():
+    signal = parser.parse(NBSP_SAMPLE)
+
+    assert signal.take_profits[0] == 2660.0
+    assert signal.stop_loss == 2640.0
+
+
+@pytest.mark.parametrize("pattern", [
+    signal_parser_module._SIGNAL_PATTERN,
+    signal_parser_module._PIP_PATTERN,
+])
+def test_backend_equivalence(pattern):
+    re2 = pytest.importorskip("re2")
+    engines = (re.compile(pattern), re2.compile(pattern))
 
+    for text in ENGINE_CORPUS:
+        for candidate in (text, parser.normalize_text(text)):
+            std, alt = (
+                [(m.lastgroup, m.span(), m.groups()) for m in engine.finditer(candidate)]
+                for engine in engines
+            )
+            assert std == alt, candidate